@@ -5,21 +5,56 @@ This example shows how to integrate EthicalZen guardrails
 as a LangChain component for input/output filtering.
 
 Run:
-    pip install langchain requests
+    pip install langchain ethicalzen
     ETHICALZEN_API_KEY=sk-... python guardrail_chain.py
 """
 
+import asyncio
 import os
-import requests
-from typing import List, Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 from langchain.schema import BaseMessage, HumanMessage, AIMessage
-from langchain.callbacks.manager import CallbackManagerForChainRun
+from langchain.callbacks.manager import (
+    AsyncCallbackManagerForChainRun,
+    CallbackManagerForChainRun,
+)
 from langchain.chains.base import Chain
 
-ETHICALZEN_API_URL = "https://api.ethicalzen.ai/api/sg/evaluate"
+from ethicalzen import AsyncEthicalZen
+
+ETHICALZEN_BASE_URL = "https://api.ethicalzen.ai"
 ETHICALZEN_API_KEY = os.environ.get("ETHICALZEN_API_KEY", "")
 
 
+# Background event loop for running async guardrail checks from sync code.
+# An httpx.AsyncClient pool is bound to one loop, so a single long-lived loop
+# (rather than asyncio.run per call) lets the shared AsyncEthicalZen be reused.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _submit(coro):
+    """Schedule a coroutine on the shared background loop."""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(
+                target=_LOOP.run_forever, name="ethicalzen-loop", daemon=True
+            ).start()
+    return asyncio.run_coroutine_threadsafe(coro, _LOOP)
+
+
+def _run_sync(coro):
+    """Run a coroutine on the shared background loop and wait for the result."""
+    return _submit(coro).result()
+
+
+def _run_async(coro):
+    """Run a coroutine on the shared background loop from another event loop."""
+    return asyncio.wrap_future(_submit(coro))
+
+
 class EthicalZenGuardrail:
     """EthicalZen guardrail wrapper for LangChain."""
 
@@ -27,53 +62,88 @@ class EthicalZenGuardrail:
         self,
         guardrails: List[str],
         api_key: Optional[str] = None,
-        fail_action: str = "block"  # "block" or "warn"
+        fail_action: str = "block",  # "block" or "warn"
+        cache_ttl: float = 300.0,
+        async_client: Optional[AsyncEthicalZen] = None
     ):
         self.guardrails = guardrails
         self.api_key = api_key or ETHICALZEN_API_KEY
         self.fail_action = fail_action
+        self.async_client = async_client
+        self.cache_ttl = cache_ttl
 
     def evaluate(self, text: str) -> dict:
-        """Evaluate text against all configured guardrails."""
+        """Evaluate text against all configured guardrails concurrently."""
+        # Same transport as aevaluate, run on the shared background loop
+        return _run_sync(self.aevaluate(text))
+
+    async def aevaluate(self, text: str) -> dict:
+        """Evaluate text against all configured guardrails in parallel (async)."""
+        if self.async_client is None:
+            # The client caches decisions itself, keyed per guardrail and input
+            self.async_client = AsyncEthicalZen(
+                api_key=self.api_key or None,
+                base_url=ETHICALZEN_BASE_URL,
+                cache_ttl=self.cache_ttl,
+            )
+
+        outcomes = await asyncio.gather(
+            *[self.async_client.evaluate(g, text) for g in self.guardrails],
+            return_exceptions=True
+        )
+
         results = []
         blocked = False
-
-        for guardrail in self.guardrails:
-            try:
-                response = requests.post(
-                    ETHICALZEN_API_URL,
-                    headers={
-                        "X-API-Key": self.api_key,
-                        "Content-Type": "application/json"
-                    },
-                    json={"guardrail": guardrail, "input": text}
-                )
-                result = response.json()
-                results.append({
-                    "guardrail": guardrail,
-                    "decision": result.get("decision", "allow"),
-                    "score": result.get("score", 0),
-                    "reason": result.get("reason", "")
-                })
-                
-                if result.get("decision") == "block":
-                    blocked = True
-                    
-            except Exception as e:
+        for guardrail, outcome in zip(self.guardrails, outcomes):
+            if isinstance(outcome, Exception):
                 results.append({
                     "guardrail": guardrail,
                     "decision": "error",
-                    "error": str(e)
+                    "error": str(outcome)
                 })
                 if self.fail_action == "block":
                     blocked = True
-        
+                continue
+
+            results.append({
+                "guardrail": guardrail,
+                "decision": outcome.decision.value.lower(),
+                "score": outcome.score,
+                "reason": outcome.reason or ""
+            })
+            if outcome.is_blocked:
+                blocked = True
+
         return {
             "blocked": blocked,
             "results": results
         }
 
 
+# Guards by guardrail list, sharing one client, so the client's pool and the
+# guards' caches are reused across calls. Kept outside GuardrailChain: Chain is
+# a pydantic v1 model before LangChain 0.3 and a v2 model after, and the two
+# declare private attributes differently.
+_GUARDS: Dict[Tuple[str, ...], EthicalZenGuardrail] = {}
+_GUARDS_LOCK = threading.Lock()
+_ASYNC_CLIENT: Optional[AsyncEthicalZen] = None
+
+
+def _guard(guardrails: List[str]) -> EthicalZenGuardrail:
+    """Return the shared guard for a list of guardrails, creating it on first use."""
+    global _ASYNC_CLIENT
+    key = tuple(guardrails)
+    with _GUARDS_LOCK:
+        guard = _GUARDS.get(key)
+        if guard is None:
+            if _ASYNC_CLIENT is None:
+                _ASYNC_CLIENT = AsyncEthicalZen(
+                    api_key=ETHICALZEN_API_KEY or None, base_url=ETHICALZEN_BASE_URL
+                )
+            guard = _GUARDS[key] = EthicalZenGuardrail(guardrails, async_client=_ASYNC_CLIENT)
+        return guard
+
+
 class GuardrailChain(Chain):
     """
     LangChain chain that wraps another chain with guardrail protection.
@@ -94,12 +164,24 @@ class GuardrailChain(Chain):
         )
         
         result = protected_chain.run("What is Python?")
+        
+        # From async code (e.g. LangChain async runners), use the async API so
+        # guardrail checks don't block the event loop:
+        result = await protected_chain.arun("What is Python?")
     """
     
     chain: Chain
     input_guardrails: List[str] = []
     output_guardrails: List[str] = []
     blocked_response: str = "I'm unable to process this request due to safety guidelines."
+
+    @property
+    def _input_guard(self) -> EthicalZenGuardrail:
+        return _guard(self.input_guardrails)
+
+    @property
+    def _output_guard(self) -> EthicalZenGuardrail:
+        return _guard(self.output_guardrails)
     
     @property
     def input_keys(self) -> List[str]:
@@ -109,6 +191,14 @@ class GuardrailChain(Chain):
     def output_keys(self) -> List[str]:
         return self.chain.output_keys
     
+    def _blocked_output(self, result: dict) -> dict:
+        blocked_by = [r for r in result["results"] if r["decision"] == "block"]
+        return {
+            self.output_keys[0]: self.blocked_response,
+            "_guardrail_blocked": True,
+            "_blocked_by": blocked_by
+        }
+    
     def _call(
         self,
         inputs: dict,
@@ -117,16 +207,10 @@ class GuardrailChain(Chain):
         # Check input guardrails
         if self.input_guardrails:
             input_text = " ".join(str(v) for v in inputs.values())
-            guardrail = EthicalZenGuardrail(self.input_guardrails)
-            result = guardrail.evaluate(input_text)
+            result = self._input_guard.evaluate(input_text)
             
             if result["blocked"]:
-                blocked_by = [r for r in result["results"] if r["decision"] == "block"]
-                return {
-                    self.output_keys[0]: self.blocked_response,
-                    "_guardrail_blocked": True,
-                    "_blocked_by": blocked_by
-                }
+                return self._blocked_output(result)
         
         # Run the actual chain
         output = self.chain._call(inputs, run_manager)
@@ -134,19 +218,114 @@ class GuardrailChain(Chain):
         # Check output guardrails
         if self.output_guardrails:
             output_text = " ".join(str(v) for v in output.values())
-            guardrail = EthicalZenGuardrail(self.output_guardrails)
-            result = guardrail.evaluate(output_text)
+            result = self._output_guard.evaluate(output_text)
             
             if result["blocked"]:
-                blocked_by = [r for r in result["results"] if r["decision"] == "block"]
-                return {
-                    self.output_keys[0]: self.blocked_response,
-                    "_guardrail_blocked": True,
-                    "_blocked_by": blocked_by
-                }
+                return self._blocked_output(result)
         
         return output
     
+    async def _acall(
+        self,
+        inputs: dict,
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None
+    ) -> dict:
+        # Same flow as _call, but awaits the checks instead of blocking the loop
+        if self.input_guardrails:
+            input_text = " ".join(str(v) for v in inputs.values())
+            result = await _run_async(self._input_guard.aevaluate(input_text))
+            
+            if result["blocked"]:
+                return self._blocked_output(result)
+        
+        # Run the actual chain
+        output = await self.chain._acall(inputs, run_manager)
+        
+        # Check output guardrails
+        if self.output_guardrails:
+            output_text = " ".join(str(v) for v in output.values())
+            result = await _run_async(self._output_guard.aevaluate(output_text))
+            
+            if result["blocked"]:
+                return self._blocked_output(result)
+        
+        return output
+    
+    async def astream_guarded(self, inputs: dict, chunk_window: int = 200):
+        """
+        Stream the wrapped chain's output, checking output guardrails as it arrives.
+
+        Output is released in windows of about ``chunk_window`` characters. A
+        window is yielded only once its guardrail check passes, while the next
+        window keeps generating. On a violation the blocked response is yielded
+        and the stream stops, so no further tokens are consumed.
+
+        Named apart from Runnable.astream, which keeps LangChain's signature and
+        runs the chain without streamed guardrail checks.
+
+        Usage:
+            async for text in protected_chain.astream_guarded({"question": "..."}):
+                print(text, end="")
+        """
+        if self.input_guardrails:
+            input_text = " ".join(str(v) for v in inputs.values())
+            result = await _run_async(self._input_guard.aevaluate(input_text))
+            if result["blocked"]:
+                yield self.blocked_response
+                return
+
+        output_text = ""
+        window = ""
+        in_flight = None  # (guardrail check, text to release once it passes)
+
+        async for chunk in self.chain.astream(inputs):
+            if isinstance(chunk, dict):
+                # Chunks also echo the input keys; only the output is streamed
+                piece = "".join(str(chunk[k]) for k in self.output_keys if k in chunk)
+                if not piece:
+                    continue
+            else:
+                piece = str(chunk)
+
+            if not self.output_guardrails:
+                yield piece
+                continue
+
+            output_text += piece
+            window += piece
+            if len(window) < chunk_window:
+                continue
+
+            if in_flight is not None:
+                result = await in_flight[0]
+                if result["blocked"]:
+                    yield self.blocked_response
+                    return
+                yield in_flight[1]
+
+            # Check the newest window plus some preceding context
+            tail = output_text[-2 * chunk_window:]
+            in_flight = (_run_async(self._output_guard.aevaluate(tail)), window)
+            window = ""
+
+        if not self.output_guardrails:
+            return
+
+        if in_flight is not None:
+            result = await in_flight[0]
+            if result["blocked"]:
+                yield self.blocked_response
+                return
+            yield in_flight[1]
+
+        # Final check over the complete output, as in _call
+        result = await _run_async(self._output_guard.aevaluate(output_text))
+        if result["blocked"]:
+            yield self.blocked_response
+            return
+        if window:
+            yield window
+    
     @property
     def _chain_type(self) -> str:
         return "guardrail_chain"
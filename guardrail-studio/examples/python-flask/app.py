@@ -5,36 +5,78 @@ This example shows how to integrate EthicalZen guardrails
 into a Flask API that wraps an LLM.
 
 Run:
-    pip install flask requests
+    pip install flask "httpx[http2]" orjson waitress ethicalzen
     ETHICALZEN_API_KEY=sk-... python app.py
+
+Or with gunicorn:
+    gunicorn -w 4 -k gthread --threads 8 app:app
 """
 
+import httpx
+import orjson
 import os
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from flask import Flask, request, jsonify
 
+from ethicalzen.cache import TTLCache, evaluation_key
+
 app = Flask(__name__)
 
 # EthicalZen API configuration
 ETHICALZEN_API_URL = "https://api.ethicalzen.ai/api/sg/evaluate"
 ETHICALZEN_API_KEY = os.environ.get("ETHICALZEN_API_KEY", "")
 
+# Shared HTTP/2 client: concurrent guardrail checks multiplex over one connection
+_HTTPX = httpx.Client(
+    headers={
+        "X-API-Key": ETHICALZEN_API_KEY,
+        "Content-Type": "application/json"
+    },
+    transport=httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32),
+        retries=2,
+    ),
+    timeout=10.0,
+)
+
+# Request threads for the WSGI server started in __main__
+_SERVER_THREADS = 16
+
+# Worker threads for checking several guardrails at once. Each request thread
+# checks its first guardrail inline and hands the rest here, so /chat's three
+# guardrails need two workers per request thread to never queue
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_SERVER_THREADS * 2, thread_name_prefix="ethicalzen-guardrail"
+)
+
+# LRU cache of recent decisions so repeated prompts skip the API call
+_CACHE = TTLCache(maxsize=10_000, ttl=300.0)
+
 
 def evaluate_guardrail(guardrail: str, input_text: str) -> dict:
     """Call EthicalZen API to evaluate content against a guardrail."""
-    response = requests.post(
+    key = evaluation_key(guardrail, input_text)
+    cached = _CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    response = _HTTPX.post(
         ETHICALZEN_API_URL,
-        headers={
-            "X-API-Key": ETHICALZEN_API_KEY,
-            "Content-Type": "application/json"
-        },
-        json={
+        content=orjson.dumps({
             "guardrail": guardrail,
             "input": input_text
-        }
+        })
     )
-    return response.json()
+    result = orjson.loads(response.content)
+
+    # Only cache real decisions; a 429/5xx body must not be reused for the TTL
+    if not response.is_success or not isinstance(result, dict) or "decision" not in result:
+        return result
+
+    _CACHE.set(key, result)
+    return result
 
 
 def guardrail_protected(guardrails: list):
@@ -54,13 +96,19 @@ def guardrail_protected(guardrails: list):
             data = request.get_json() or {}
             user_input = data.get('message') or data.get('prompt') or ''
             
-            if not user_input:
+            if not user_input or not guardrails:
                 return f(*args, **kwargs)
             
-            # Check against all guardrails
-            for guardrail in guardrails:
+            # Check against all guardrails concurrently; the first runs on this thread
+            futures = [
+                (guardrail, _EXECUTOR.submit(evaluate_guardrail, guardrail, user_input))
+                for guardrail in guardrails[1:]
+            ]
+            checks = [(guardrails[0], lambda: evaluate_guardrail(guardrails[0], user_input))]
+            checks += [(guardrail, future.result) for guardrail, future in futures]
+            for guardrail, check in checks:
                 try:
-                    result = evaluate_guardrail(guardrail, user_input)
+                    result = check()
                     
                     if result.get('decision') == 'block':
                         return jsonify({
@@ -124,5 +172,8 @@ if __name__ == '__main__':
     
     print("Starting server...")
     print("POST /chat with { 'message': 'your message' }")
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Production WSGI server; its threads and _EXECUTOR's workers share _HTTPX,
+    # whose HTTP/2 connection multiplexes all of their in-flight checks
+    from waitress import serve
+    serve(app, host='0.0.0.0', port=5000, threads=_SERVER_THREADS)
 
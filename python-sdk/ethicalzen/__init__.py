@@ -16,7 +16,7 @@ Usage:
 """
 
 from ethicalzen.client import EthicalZen, AsyncEthicalZen
-from ethicalzen.proxy import EthicalZenProxy, ProxyResponse, wrap_openai
+from ethicalzen.proxy import EthicalZenProxy, AsyncEthicalZenProxy, ProxyResponse, wrap_openai
 from ethicalzen.models import (
     EvaluationResult,
     GuardrailConfig,
@@ -39,6 +39,7 @@ __all__ = [
     "AsyncEthicalZen",
     # Proxy
     "EthicalZenProxy",
+    "AsyncEthicalZenProxy",
     "ProxyResponse",
     "wrap_openai",
     # Models
@@ -0,0 +1,23 @@
+"""JSON encoding helpers (uses orjson when installed)."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
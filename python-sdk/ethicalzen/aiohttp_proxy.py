@@ -0,0 +1,174 @@
+"""
+aiohttp-backed async proxy client.
+
+aiohttp's C HTTP parser has lower per-request overhead than httpx, which adds
+up for batch workloads with thousands of requests. Install with:
+
+    pip install "ethicalzen[aiohttp]"
+
+For the lowest overhead, also install uvloop and call ``uvloop.install()``
+before starting the event loop.
+
+Usage:
+    from ethicalzen.aiohttp_proxy import AiohttpEthicalZenProxy
+
+    async with AiohttpEthicalZenProxy(certificate_id="dc_my_app") as proxy:
+        response = await proxy.chat_completions(
+            target_api_key="sk-openai-key",
+            model="gpt-4",
+            messages=[{"role": "user", "content": "Hello"}],
+        )
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from ethicalzen.proxy import (
+    AsyncEthicalZenProxy,
+    _is_event_stream,
+    _stream_event,
+    _stream_fallback,
+)
+
+try:
+    import aiohttp
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without the extra
+    AIOHTTP_AVAILABLE = False
+
+
+# Already decoded by aiohttp; httpx would try to decode the body again
+_HOP_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+# AsyncEthicalZenProxy options for its httpx pool, which this class doesn't use
+_HTTPX_POOL_OPTIONS = frozenset(
+    {"http2", "max_connections", "max_keepalive_connections", "keepalive_expiry"}
+)
+
+
+def _to_httpx(response: Any, content: bytes) -> httpx.Response:
+    """Wrap a read aiohttp response so the shared httpx parsing can handle it."""
+    headers = [(k, v) for k, v in response.headers.items() if k.lower() not in _HOP_HEADERS]
+    return httpx.Response(response.status, headers=headers, content=content)
+
+
+class AiohttpEthicalZenProxy(AsyncEthicalZenProxy):
+    """
+    AsyncEthicalZenProxy that talks to the gateway over aiohttp.
+
+    Behaves like AsyncEthicalZenProxy (caching, retries, rate limits,
+    streaming). Fail-open direct calls still use httpx.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        limit: int = 200,
+        limit_per_host: int = 100,
+        keepalive_timeout: float = 120.0,
+        dns_cache_ttl: Optional[int] = 300,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the proxy client.
+
+        Args:
+            limit: Maximum open connections
+            limit_per_host: Maximum open connections to one host
+            keepalive_timeout: Seconds an idle connection is kept alive
+            dns_cache_ttl: Seconds DNS lookups are cached, None to cache forever.
+                Saves a lookup for each new gateway connection.
+            *args, **kwargs: Same as AsyncEthicalZenProxy, except its httpx
+                pool options (http2, max_connections, max_keepalive_connections,
+                keepalive_expiry), which raise TypeError. aiohttp speaks
+                HTTP/1.1 only; size the pool with the arguments above.
+
+        timeout bounds connecting and each read, not the whole request, so
+        long streams aren't cut off while tokens keep arriving.
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError(
+                "AiohttpEthicalZenProxy requires aiohttp. "
+                'Install it with: pip install "ethicalzen[aiohttp]"'
+            )
+        unsupported = sorted(_HTTPX_POOL_OPTIONS.intersection(kwargs))
+        if unsupported:
+            raise TypeError(
+                f"AiohttpEthicalZenProxy does not accept {', '.join(unsupported)}; "
+                "use limit, limit_per_host and keepalive_timeout instead"
+            )
+        self._connector_options: Dict[str, Any] = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "use_dns_cache": True,
+            "ttl_dns_cache": dns_cache_ttl,
+        }
+        # Created on first use, inside the running event loop
+        self._session: Optional["aiohttp.ClientSession"] = None
+        super().__init__(*args, **kwargs)
+
+    def _create_client(self, limits: httpx.Limits) -> Any:
+        """No httpx gateway client; the aiohttp session is created lazily."""
+        return None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the aiohttp session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**self._connector_options),
+                timeout=aiohttp.ClientTimeout(
+                    total=None, sock_connect=self.timeout, sock_read=self.timeout
+                ),
+            )
+        return self._session
+
+    async def _gateway_post(
+        self, headers: Dict[str, str], content: Optional[bytes]
+    ) -> httpx.Response:
+        """POST an encoded request to the gateway."""
+        try:
+            async with self._get_session().post(
+                self._proxy_endpoint, headers=headers, data=content
+            ) as response:
+                return _to_httpx(response, await response.read())
+        except asyncio.TimeoutError as e:
+            raise httpx.TimeoutException(str(e) or "timed out")
+        except aiohttp.ClientError as e:
+            raise httpx.TransportError(str(e))
+
+    async def _gateway_stream(
+        self,
+        headers: Dict[str, str],
+        content: Optional[bytes],
+    ) -> AsyncIterator[str]:
+        """POST an encoded streaming request to the gateway, yielding content deltas."""
+        try:
+            async with self._get_session().post(
+                self._proxy_endpoint, headers=headers, data=content
+            ) as response:
+                if not _is_event_stream(response):
+                    yield _stream_fallback(_to_httpx(response, await response.read()))
+                    return
+                async for raw in response.content:
+                    text, done = _stream_event(raw.decode("utf-8").rstrip("\r\n"))
+                    if text:
+                        yield text
+                    if done:
+                        break
+        except asyncio.TimeoutError as e:
+            raise httpx.TimeoutException(str(e) or "timed out")
+        except aiohttp.ClientError as e:
+            raise httpx.TransportError(str(e))
+
+    async def aclose(self) -> None:
+        """Close the aiohttp session and fail-open clients."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        for client in self._direct_clients.values():
+            await client.aclose()
+        self._direct_clients.clear()
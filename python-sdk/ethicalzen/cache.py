@@ -0,0 +1,283 @@
+"""Caching for EthicalZen SDK."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterator, List, MutableMapping, Optional, Tuple
+
+DEFAULT_CACHE_SIZE = 10_000
+DEFAULT_CACHE_TTL = 300.0  # seconds
+DISK_CACHE_SIZE_LIMIT = 10 * 1024**3  # bytes
+DISK_CACHE_EVICT_TO = 0.9  # fraction of size_limit left after an eviction pass
+NEGATIVE_CACHE_SIZE = 1024
+NEGATIVE_CACHE_TTL = 60.0  # seconds to remember unknown guardrail IDs
+METADATA_CACHE_SIZE = 256
+METADATA_CACHE_TTL = 60.0  # seconds before template/guardrail listings are revalidated
+
+
+def evaluation_key(
+    guardrail: str,
+    input: str,  # noqa: A002 - using 'input' to match API
+    context: Optional[Dict[str, Any]] = None,
+    version: int = 0,
+) -> bytes:
+    """
+    Build a content-addressable cache key for a guardrail evaluation.
+
+    version changes whenever the guardrail is redesigned or optimized, so
+    decisions made by an older configuration are no longer found.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(guardrail.encode("utf-8"))
+    h.update(b"\0")
+    if version:
+        h.update(str(version).encode("ascii"))
+        h.update(b"\0")
+    h.update(input.encode("utf-8"))
+    h.update(b"\0")
+    if context:
+        h.update(json.dumps(context, sort_keys=True, default=str).encode("utf-8"))
+    return h.digest()
+
+
+def request_key(
+    method: str,
+    url: str,
+    body: Any,
+    certificate_id: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+    gateway: Optional[Dict[str, Optional[str]]] = None,
+) -> bytes:
+    """
+    Build a content-addressable cache key for a proxied request.
+
+    gateway identifies who the gateway evaluated the request for (gateway URL,
+    API key, tenant); responses cached for one must never be served to another.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(
+        json.dumps(
+            {
+                "method": method.upper(),
+                "url": url,
+                "body": body,
+                "cert": certificate_id,
+                # Target credentials change who the response belongs to
+                "headers": headers or {},
+                "gateway": gateway or {},
+            },
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+    )
+    return h.digest()
+
+
+_MISSING = object()
+
+
+class TTLCache(MutableMapping[Hashable, Any]):
+    """
+    Thread-safe LRU cache whose entries expire after a fixed TTL.
+
+    Also usable as a MutableMapping (``cache[key] = value``), so it can stand
+    in wherever a plain dict cache is accepted.
+
+    Usage:
+        cache = TTLCache(maxsize=1000, ttl=60)
+        cache.set("key", value)
+        cache.get("key")  # value, or None once expired/evicted
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, ttl: float = DEFAULT_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Insert a value, evicting the least recently used entry if full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove an entry, if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            del self._data[key]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """
+    Cache stored as one JSON file per entry in a directory, so entries outlive the process.
+
+    Entries are written to a temporary file and renamed into place, so readers
+    (including other processes) never see a partial entry. Once the directory
+    holds more than size_limit bytes, the least recently written entries are
+    removed until it is back under DISK_CACHE_EVICT_TO of the limit, so the
+    directory is rescanned only after a tenth of the limit has been written
+    again. Values must be JSON-serializable and keys are bytes.
+
+    Usage:
+        cache = DiskCache("~/.cache/ethicalzen", ttl=3600)
+        cache.set(b"key", {"answer": 42})
+        cache.get(b"key")  # {"answer": 42}, or None once expired
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        ttl: Optional[float] = None,
+        size_limit: int = DISK_CACHE_SIZE_LIMIT,
+    ):
+        self.directory = os.path.expanduser(directory)
+        self.ttl = ttl
+        self.size_limit = size_limit
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # Approximate, since other processes may share the directory; unknown
+        # until the first write scans it, then corrected by each eviction pass
+        self._size: Optional[int] = None
+        self._evicting = False
+
+    def _path(self, key: bytes) -> str:
+        return os.path.join(self.directory, key.hex() + ".json")
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """(mtime, size, path) of each entry on disk."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the cached value, or None if missing, unreadable or expired."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                expires_at, value = json.loads(f.read())
+        except (OSError, ValueError, TypeError):
+            return None
+        if expires_at is not None and expires_at < time.time():
+            _unlink(path)
+            return None
+        return value
+
+    def set(self, key: bytes, value: Any) -> None:
+        """Write a value atomically. Failures are ignored; the entry is just not cached."""
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        tmp = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.directory, suffix=".tmp", delete=False, encoding="utf-8"
+            ) as f:
+                tmp = f.name
+                json.dump([expires_at, value], f, default=str)
+                size = f.tell()
+            os.replace(tmp, self._path(key))
+        except (OSError, ValueError):
+            if tmp is not None:
+                _unlink(tmp)
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size += size
+                if self._size <= self.size_limit:
+                    return
+            if self._evicting:
+                # Another writer is already scanning; it will count this entry
+                return
+            self._evicting = True
+        try:
+            self._evict()
+        finally:
+            with self._lock:
+                self._evicting = False
+
+    def _evict(self) -> None:
+        """Rescan the directory and remove the oldest entries if it exceeds size_limit.
+
+        Runs without the lock so other writers aren't held up by the scan.
+        """
+        entries = sorted(self._entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        if size > self.size_limit:
+            target = self.size_limit * DISK_CACHE_EVICT_TO
+            for _, entry_size, path in entries:
+                if size <= target:
+                    break
+                _unlink(path)
+                size -= entry_size
+        with self._lock:
+            self._size = size
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            for _, _, path in self._entries():
+                _unlink(path)
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+
+def _unlink(path: str) -> None:
+    """Remove a file, ignoring errors (e.g. another process removed it first)."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
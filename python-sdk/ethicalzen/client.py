@@ -1,18 +1,23 @@
 """EthicalZen API client implementations."""
 
+import asyncio
 import os
-from typing import Any, Dict, List, Optional, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
 import httpx
 
-from ethicalzen.models import (
-    Decision,
-    DesignResult,
-    EvaluationResult,
-    GuardrailConfig,
-    OptimizeResult,
-    SimulationResult,
-    Template,
+from ethicalzen._json import dumps, loads
+from ethicalzen.cache import (
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL,
+    METADATA_CACHE_SIZE,
+    METADATA_CACHE_TTL,
+    NEGATIVE_CACHE_SIZE,
+    NEGATIVE_CACHE_TTL,
+    TTLCache,
+    evaluation_key,
 )
 from ethicalzen.exceptions import (
     APIError,
@@ -22,11 +27,182 @@ from ethicalzen.exceptions import (
     RateLimitError,
     ValidationError,
 )
-
+from ethicalzen.models import (
+    Decision,
+    DesignResult,
+    EvaluationResult,
+    GuardrailConfig,
+    OptimizeResult,
+    SimulationResult,
+    Template,
+)
 
 DEFAULT_BASE_URL = "https://ethicalzen-backend-400782183161.us-central1.run.app"
 DEFAULT_TIMEOUT = 60.0
 MAX_INPUT_LENGTH = 100000  # 100KB max input to prevent DoS
+MAX_BATCH_WORKERS = 8
+
+EVALUATE_PATH = "/api/sg/evaluate"
+EVALUATE_BATCH_PATH = "/api/sg/evaluate_batch"
+GUARDRAILS_PATH = "/api/sg/list"
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5  # seconds, doubled on each retry
+MAX_RETRY_BACKOFF = 30.0
+
+
+def _batch_enabled_from_env() -> bool:
+    """Whether the server-side batch endpoint is enabled via ETHICALZEN_BATCH."""
+    return os.environ.get("ETHICALZEN_BATCH", "").lower() in ("1", "true", "yes")
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header in delta-seconds form, clamped to [0, MAX_RETRY_BACKOFF].
+
+    Returns None when it is missing or an HTTP-date, so callers fall back to backoff.
+    """
+    if not value:
+        return None
+    try:
+        # Clamped so a bogus or hostile value can't stall the caller or go negative
+        return min(max(float(value), 0.0), MAX_RETRY_BACKOFF)
+    except ValueError:
+        return None
+
+
+def _validate_evaluation(guardrail: str, input: str) -> None:  # noqa: A002
+    """Validate evaluate() arguments before any network call."""
+    if not guardrail:
+        raise ValidationError("guardrail is required", field="guardrail")
+    if not input:
+        raise ValidationError("input is required", field="input")
+    if len(input) > MAX_INPUT_LENGTH:
+        raise ValidationError(
+            f"input exceeds maximum length of {MAX_INPUT_LENGTH} characters",
+            field="input"
+        )
+
+
+def _build_evaluation_result(data: Dict[str, Any], guardrail: str) -> EvaluationResult:
+    """Build an EvaluationResult from an evaluate API payload."""
+    # Decision case is normalized by EvaluationResult (API returns lowercase)
+    return EvaluationResult(
+        decision=data.get("decision", Decision.ALLOW),
+        score=data.get("score", 0.0),
+        reason=data.get("reason"),
+        guardrail_id=guardrail,
+        latency_ms=data.get("latency_ms"),
+        metadata=data.get("metadata"),
+    )
+
+
+def _parse_templates(data: Dict[str, Any]) -> List[Template]:
+    """Build Template objects from a list-templates payload."""
+    templates = []
+    for t in data.get("templates", []):
+        # Backend returns: type, displayName, description, exampleCount, expectedMetrics
+        templates.append(Template(
+            id=t.get("type", ""),  # 'type' is the template ID
+            name=t.get("displayName", ""),  # 'displayName' is the name
+            description=t.get("description", ""),
+            category=t.get("category", "general"),
+            accuracy=t.get("expectedMetrics", {}).get("accuracy"),
+        ))
+
+    return templates
+
+
+def _parse_template(data: Dict[str, Any], template_id: str) -> Template:
+    """Build a Template (with examples) from a get-template payload."""
+    t = data.get("template", {})
+    return Template(
+        id=data.get("type", template_id),
+        name=t.get("displayName", ""),
+        description=t.get("description", ""),
+        category="general",
+        accuracy=t.get("expectedAccuracy"),
+        safe_examples=t.get("safeExamples", []),
+        unsafe_examples=t.get("unsafeExamples", []),
+    )
+
+
+def _parse_guardrails(data: Dict[str, Any]) -> List[GuardrailConfig]:
+    """Build GuardrailConfig objects from a list-guardrails payload."""
+    guardrails = []
+    for g in data.get("guardrails", []):
+        guardrails.append(GuardrailConfig(
+            id=g.get("id", ""),
+            name=g.get("name", ""),
+            description=g.get("description", ""),
+            t_allow=g.get("thresholdLow", g.get("t_allow", 0.30)),
+            t_block=g.get("thresholdHigh", g.get("t_block", 0.70)),
+            safe_examples=g.get("safeExamples", g.get("safe_examples", [])),
+            unsafe_examples=g.get("unsafeExamples", g.get("unsafe_examples", [])),
+        ))
+
+    return guardrails
+
+
+def _conditional_payload(
+    client: Union["EthicalZen", "AsyncEthicalZen"],
+    path: str,
+    response: httpx.Response,
+) -> Dict[str, Any]:
+    """Resolve a conditional GET: reuse the cached body on 304, else store the ETag."""
+    cached = client._etags.get(path)
+    if response.status_code == 304 and cached is not None:
+        return cached[1]
+
+    data = client._handle_response(response)
+    etag = response.headers.get("ETag")
+    if etag:
+        client._etags[path] = (etag, data)
+    return data
+
+
+def _forget_listing(client: Union["EthicalZen", "AsyncEthicalZen"], path: str) -> None:
+    """Drop a cached listing and its ETag after a call that changes it."""
+    client._metadata.delete(path)
+    client._etags.pop(path, None)
+
+
+def _forget_guardrail(client: Union["EthicalZen", "AsyncEthicalZen"], guardrail: str) -> None:
+    """Invalidate cached decisions and a remembered 404 for a changed guardrail."""
+    client._not_found.delete(guardrail)
+    # Bumping the version retires every cached decision for the guardrail at once
+    client._guardrail_versions[guardrail] = client._guardrail_versions.get(guardrail, 0) + 1
+
+
+class _RequestTemplate:
+    """Pre-merged URL, headers and extensions for one POST endpoint."""
+
+    __slots__ = ("url", "headers", "extensions")
+
+    def __init__(self, client: Union[httpx.Client, httpx.AsyncClient], path: str):
+        request = client.build_request("POST", path)
+        self.url = request.url
+        self.headers = request.headers
+        # Recomputed from the body of each request
+        del self.headers["Content-Length"]
+        self.extensions = request.extensions
+
+    def build(self, content: bytes) -> httpx.Request:
+        """Build a request for this endpoint without re-merging client defaults."""
+        return httpx.Request(
+            "POST", self.url, headers=self.headers, content=content, extensions=self.extensions
+        )
+
+
+def _batch_results(data: Dict[str, Any], expected: int) -> List[Dict[str, Any]]:
+    """Extract the in-order per-item payloads from a batch evaluate response."""
+    results = data.get("results")
+    if not isinstance(results, list) or len(results) != expected:
+        raise APIError(
+            "Batch evaluation returned an unexpected number of results",
+            response_body=str(data),
+        )
+    return results
 
 
 class EthicalZen:
@@ -51,6 +227,9 @@ class EthicalZen:
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         timeout: float = DEFAULT_TIMEOUT,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        batch: Optional[bool] = None,
     ):
         """
         Initialize the EthicalZen client.
@@ -60,6 +239,10 @@ class EthicalZen:
                      ETHICALZEN_API_KEY environment variable.
             base_url: API base URL. Defaults to production API.
             timeout: Request timeout in seconds. Default is 60s.
+            cache_size: Maximum number of cached evaluations. 0 disables caching.
+            cache_ttl: Seconds a cached evaluation stays valid. Default is 300s.
+            batch: Send evaluate_many() as one request to the batch endpoint.
+                   Defaults to the ETHICALZEN_BATCH environment variable.
         """
         self.api_key = api_key or os.environ.get("ETHICALZEN_API_KEY")
         if not self.api_key:
@@ -69,6 +252,17 @@ class EthicalZen:
         
         self.base_url = (base_url or os.environ.get("ETHICALZEN_BASE_URL") or DEFAULT_BASE_URL).rstrip("/")
         self.timeout = timeout
+        self.batch = _batch_enabled_from_env() if batch is None else batch
+        self._cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        # Terminal failures are remembered so repeat calls fail without a round-trip
+        self._not_found = TTLCache(maxsize=NEGATIVE_CACHE_SIZE, ttl=NEGATIVE_CACHE_TTL)
+        self._auth_failed = False
+        # Template/guardrail listings: fresh for a TTL, then revalidated by ETag
+        self._metadata = TTLCache(maxsize=METADATA_CACHE_SIZE, ttl=METADATA_CACHE_TTL)
+        self._etags: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        # Bumped when a guardrail changes; part of its evaluation cache keys
+        self._guardrail_versions: Dict[str, int] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
         
         self._client = httpx.Client(
             base_url=self.base_url,
@@ -79,38 +273,79 @@ class EthicalZen:
             },
             timeout=timeout,
         )
+        self._templates: Dict[str, _RequestTemplate] = {}
 
     def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
         """Handle API response and raise appropriate exceptions."""
         if response.status_code == 401:
+            self._auth_failed = True
             raise AuthenticationError("Invalid API key")
         
         if response.status_code == 429:
-            retry_after = response.headers.get("Retry-After")
             raise RateLimitError(
                 "Rate limit exceeded. Please slow down or upgrade your plan.",
-                retry_after=int(retry_after) if retry_after else None
+                retry_after=_retry_after_seconds(response.headers.get("Retry-After")),
             )
         
         if response.status_code == 404:
-            data = response.json() if response.text else {}
+            data = loads(response.content) if response.content else {}
             raise GuardrailNotFoundError(data.get("guardrail_id", "unknown"))
         
         if response.status_code >= 400:
             try:
-                data = response.json()
-                message = data.get("error") or data.get("message") or "API request failed"
-            except Exception:
-                message = response.text or "API request failed"
-            raise APIError(message, status_code=response.status_code, response_body=response.text)
+                data = loads(response.content)
+            except ValueError:
+                data = None
+            raise APIError.from_response(response, data)
+
+        result: Dict[str, Any] = loads(response.content)
+        return result
+
+    def _evaluation_key(
+        self,
+        guardrail: str,
+        input: str,  # noqa: A002 - using 'input' to match API
+        context: Optional[Dict[str, Any]],
+    ) -> bytes:
+        """Cache key for an evaluation under the guardrail's current configuration."""
+        return evaluation_key(guardrail, input, context, self._guardrail_versions.get(guardrail, 0))
+
+    def _check_known(self, guardrail: Optional[str] = None) -> None:
+        """Fail fast on a rejected API key or a guardrail recently reported missing."""
+        if self._auth_failed:
+            raise AuthenticationError("Invalid API key")
+        if guardrail is not None and self._not_found.get(guardrail):
+            raise GuardrailNotFoundError(guardrail)
+
+    def _post(self, path: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a JSON body and return the decoded response."""
+        self._check_known()
+        template = self._templates.get(path)
+        if template is None:
+            template = self._templates[path] = _RequestTemplate(self._client, path)
+        response = self._client.send(template.build(dumps(body)))
+        return self._handle_response(response)
+
+    def _get(self, path: str) -> Dict[str, Any]:
+        """GET a rarely-changing resource, using the TTL cache and ETags."""
+        self._check_known()
+        data: Optional[Dict[str, Any]] = self._metadata.get(path)
+        if data is not None:
+            return data
         
-        return response.json()
+        cached = self._etags.get(path)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._client.get(path, headers=headers)
+        data = _conditional_payload(self, path, response)
+        self._metadata.set(path, data)
+        return data
 
     def evaluate(
         self,
         guardrail: str,
         input: str,  # noqa: A002 - using 'input' to match API
         context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
     ) -> EvaluationResult:
         """
         Evaluate content against a guardrail.
@@ -119,6 +354,8 @@ class EthicalZen:
             guardrail: Guardrail ID (e.g., "medical_advice_smart")
             input: The text content to evaluate
             context: Optional context for evaluation
+            use_cache: Reuse a recent result for the same guardrail, input
+                       and context instead of calling the API again
             
         Returns:
             EvaluationResult with decision, score, and reason
@@ -132,38 +369,96 @@ class EthicalZen:
             if result.is_blocked:
                 print(f"Blocked: {result.reason}")
         """
-        if not guardrail:
-            raise ValidationError("guardrail is required", field="guardrail")
-        if not input:
-            raise ValidationError("input is required", field="input")
-        if len(input) > MAX_INPUT_LENGTH:
-            raise ValidationError(
-                f"input exceeds maximum length of {MAX_INPUT_LENGTH} characters",
-                field="input"
-            )
+        _validate_evaluation(guardrail, input)
+        self._check_known(guardrail)
 
-        response = self._client.post(
-            "/api/sg/evaluate",
-            json={
-                "guardrail_id": guardrail,
-                "input": input,
-                "context": context,
-            },
-        )
+        key = self._evaluation_key(guardrail, input, context) if use_cache else None
+        data = self._cache.get(key) if key is not None else None
+        if data is None:
+            try:
+                data = self._post(
+                    EVALUATE_PATH,
+                    {
+                        "guardrail_id": guardrail,
+                        "input": input,
+                        "context": context,
+                    },
+                )
+            except GuardrailNotFoundError:
+                self._not_found.set(guardrail, True)
+                raise
+            if key is not None:
+                self._cache.set(key, data)
+
+        return _build_evaluation_result(data, guardrail)
+
+    def evaluate_many(
+        self,
+        pairs: List[Tuple[str, str]],
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+    ) -> List[EvaluationResult]:
+        """
+        Evaluate many (guardrail, input) pairs at once.
         
-        data = self._handle_response(response)
+        With batching enabled (``batch=True`` or ``ETHICALZEN_BATCH=true``) all
+        uncached pairs are sent in a single request to ``/api/sg/evaluate_batch``.
+        Otherwise pairs are evaluated concurrently over the shared connection pool.
         
-        # Normalize decision to uppercase (API returns lowercase)
-        decision_str = data.get("decision", "ALLOW").upper()
+        Args:
+            pairs: List of (guardrail_id, input) tuples
+            context: Optional context applied to every evaluation
+            use_cache: Reuse recent results for identical evaluations
+
+        Returns:
+            List of EvaluationResult in the same order as ``pairs``
+
+        Example:
+            results = client.evaluate_many([
+                ("pii_blocker", user_message),
+                ("prompt_injection", user_message),
+            ])
+            blocked = any(r.is_blocked for r in results)
+        """
+        for guardrail, text in pairs:
+            _validate_evaluation(guardrail, text)
+            self._check_known(guardrail)
         
-        return EvaluationResult(
-            decision=Decision(decision_str),
-            score=data.get("score", 0.0),
-            reason=data.get("reason"),
-            guardrail_id=guardrail,
-            latency_ms=data.get("latency_ms"),
-            metadata=data.get("metadata"),
-        )
+        if not self.batch:
+            if len(pairs) <= 1:
+                return [self.evaluate(g, i, context, use_cache) for g, i in pairs]
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=MAX_BATCH_WORKERS)
+            futures = [
+                self._executor.submit(self.evaluate, g, i, context, use_cache)
+                for g, i in pairs
+            ]
+            return [f.result() for f in futures]
+
+        # Bound once for the per-pair loops below
+        cache_get = self._cache.get
+        cache_set = self._cache.set
+        keys = [self._evaluation_key(g, i, context) if use_cache else None for g, i in pairs]
+        payloads: List[Any] = [cache_get(k) if k is not None else None for k in keys]
+        missing = [n for n, data in enumerate(payloads) if data is None]
+
+        if missing:
+            data = self._post(
+                EVALUATE_BATCH_PATH,
+                {
+                    "items": [
+                        {"guardrail_id": pairs[n][0], "input": pairs[n][1], "context": context}
+                        for n in missing
+                    ],
+                },
+            )
+            for n, item in zip(missing, _batch_results(data, len(missing))):
+                payloads[n] = item
+                if keys[n] is not None:
+                    cache_set(keys[n], item)
+
+        build = _build_evaluation_result
+        return [build(data, guardrail) for (guardrail, _), data in zip(pairs, payloads)]
 
     def design(
         self,
@@ -197,17 +492,16 @@ class EthicalZen:
         if not description:
             raise ValidationError("description is required", field="description")
 
-        response = self._client.post(
+        data = self._post(
             "/api/sg/design",
-            json={
+            {
                 "naturalLanguage": description,
                 "safeExamples": safe_examples or [],
                 "unsafeExamples": unsafe_examples or [],
                 "autoSimulate": auto_simulate,
             },
         )
-        
-        data = self._handle_response(response)
+        _forget_listing(self, GUARDRAILS_PATH)
         
         config_data = data.get("config", data)
         config = GuardrailConfig(
@@ -219,6 +513,10 @@ class EthicalZen:
             safe_examples=config_data.get("safeExamples", []),
             unsafe_examples=config_data.get("unsafeExamples", []),
         )
+        if config.id:
+            # The ID may have been reported missing, or evaluated under an
+            # older configuration, before this design
+            _forget_guardrail(self, config.id)
         
         simulation = None
         if data.get("simulation"):
@@ -263,18 +561,18 @@ class EthicalZen:
         Returns:
             SimulationResult with accuracy metrics
         """
+        self._check_known(guardrail)
         body: Dict[str, Any] = {"guardrailId": guardrail}
         if test_cases:
             body["testCases"] = test_cases
         if config:
             body["config"] = config
             
-        response = self._client.post(
-            "/api/sg/simulate",
-            json=body,
-        )
-        
-        data = self._handle_response(response)
+        try:
+            data = self._post("/api/sg/simulate", body)
+        except GuardrailNotFoundError:
+            self._not_found.set(guardrail, True)
+            raise
         metrics = data.get("metrics", {})
         
         return SimulationResult(
@@ -309,16 +607,16 @@ class EthicalZen:
         Returns:
             OptimizeResult with before/after metrics
         """
-        response = self._client.post(
+        data = self._post(
             "/api/sg/optimize",
-            json={
+            {
                 "guardrailId": guardrail,
                 "targetAccuracy": target_accuracy,
                 "maxIterations": max_iterations,
             },
         )
-        
-        data = self._handle_response(response)
+        _forget_listing(self, GUARDRAILS_PATH)
+        _forget_guardrail(self, guardrail)
         
         return OptimizeResult(
             success=data.get("success", True),
@@ -335,21 +633,7 @@ class EthicalZen:
         Returns:
             List of Template objects
         """
-        response = self._client.get("/api/sg/templates")
-        data = self._handle_response(response)
-        
-        templates = []
-        for t in data.get("templates", []):
-            # Backend returns: type, displayName, description, exampleCount, expectedMetrics
-            templates.append(Template(
-                id=t.get("type", ""),  # 'type' is the template ID
-                name=t.get("displayName", ""),  # 'displayName' is the name
-                description=t.get("description", ""),
-                category=t.get("category", "general"),
-                accuracy=t.get("expectedMetrics", {}).get("accuracy"),
-            ))
-        
-        return templates
+        return _parse_templates(self._get("/api/sg/templates"))
     
     def get_template(self, template_id: str) -> Template:
         """
@@ -361,19 +645,7 @@ class EthicalZen:
         Returns:
             Template object with examples
         """
-        response = self._client.get(f"/api/sg/templates/{template_id}")
-        data = self._handle_response(response)
-        
-        t = data.get("template", {})
-        return Template(
-            id=data.get("type", template_id),
-            name=t.get("displayName", ""),
-            description=t.get("description", ""),
-            category="general",
-            accuracy=t.get("expectedAccuracy"),
-            safe_examples=t.get("safeExamples", []),
-            unsafe_examples=t.get("unsafeExamples", []),
-        )
+        return _parse_template(self._get(f"/api/sg/templates/{template_id}"), template_id)
 
     def list_guardrails(self) -> List[GuardrailConfig]:
         """
@@ -382,22 +654,7 @@ class EthicalZen:
         Returns:
             List of GuardrailConfig objects
         """
-        response = self._client.get("/api/sg/list")
-        data = self._handle_response(response)
-        
-        guardrails = []
-        for g in data.get("guardrails", []):
-            guardrails.append(GuardrailConfig(
-                id=g.get("id", ""),
-                name=g.get("name", ""),
-                description=g.get("description", ""),
-                t_allow=g.get("thresholdLow", g.get("t_allow", 0.30)),
-                t_block=g.get("thresholdHigh", g.get("t_block", 0.70)),
-                safe_examples=g.get("safeExamples", g.get("safe_examples", [])),
-                unsafe_examples=g.get("unsafeExamples", g.get("unsafe_examples", [])),
-            ))
-        
-        return guardrails
+        return _parse_guardrails(self._get(GUARDRAILS_PATH))
 
     def get_guardrail(self, guardrail: str) -> GuardrailConfig:
         """
@@ -412,16 +669,28 @@ class EthicalZen:
         Raises:
             GuardrailNotFoundError: If guardrail not found
         """
+        self._check_known(guardrail)
+
         # List all and filter by ID (backend doesn't have single-get endpoint)
         guardrails = self.list_guardrails()
         for g in guardrails:
             if g.id == guardrail:
                 return g
         
+        # Not negative-cached: the listing may predate a guardrail created since
         raise GuardrailNotFoundError(guardrail)
 
+    def clear_cache(self) -> None:
+        """Discard all cached results, listings and remembered missing guardrails."""
+        self._cache.clear()
+        self._not_found.clear()
+        self._metadata.clear()
+        self._etags.clear()
+
     def close(self) -> None:
         """Close the HTTP client."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
         self._client.close()
 
     def __enter__(self) -> "EthicalZen":
@@ -441,15 +710,37 @@ class AsyncEthicalZen:
                 guardrail="medical_advice_smart",
                 input="What medication should I take?"
             )
+
+    In servers, use AsyncEthicalZen.shared() to reuse one client (and its
+    connection pool) per event loop instead of constructing one per request.
     """
 
+    # Keyed by event loop too: a client's pool and semaphore can't outlive its loop
+    _shared: ClassVar[
+        Dict[Tuple[Optional[asyncio.AbstractEventLoop], str, str], "AsyncEthicalZen"]
+    ] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         timeout: float = DEFAULT_TIMEOUT,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        batch: Optional[bool] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_retries: int = DEFAULT_MAX_RETRIES,
     ):
-        """Initialize the async EthicalZen client."""
+        """
+        Initialize the async EthicalZen client.
+
+        Args:
+            max_concurrency: Maximum number of in-flight API requests. Default is 16.
+            max_retries: Retries on rate limiting (429), honoring Retry-After. Default is 3.
+
+        Other arguments are the same as for EthicalZen.
+        """
         self.api_key = api_key or os.environ.get("ETHICALZEN_API_KEY")
         if not self.api_key:
             raise AuthenticationError(
@@ -458,6 +749,22 @@ class AsyncEthicalZen:
         
         self.base_url = (base_url or os.environ.get("ETHICALZEN_BASE_URL") or DEFAULT_BASE_URL).rstrip("/")
         self.timeout = timeout
+        self.batch = _batch_enabled_from_env() if batch is None else batch
+        self._cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        # Terminal failures are remembered so repeat calls fail without a round-trip
+        self._not_found = TTLCache(maxsize=NEGATIVE_CACHE_SIZE, ttl=NEGATIVE_CACHE_TTL)
+        self._auth_failed = False
+        # Template/guardrail listings: fresh for a TTL, then revalidated by ETag
+        self._metadata = TTLCache(maxsize=METADATA_CACHE_SIZE, ttl=METADATA_CACHE_TTL)
+        self._etags: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        # Bumped when a guardrail changes; part of its evaluation cache keys
+        self._guardrail_versions: Dict[str, int] = {}
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        # Created on first use so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Requests currently in flight, keyed like the cache (single-flight)
+        self._inflight: Dict[bytes, "asyncio.Future[Dict[str, Any]]"] = {}
         
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
@@ -468,72 +775,232 @@ class AsyncEthicalZen:
             },
             timeout=timeout,
         )
+        self._templates: Dict[str, _RequestTemplate] = {}
 
     def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
         """Handle API response and raise appropriate exceptions."""
         if response.status_code == 401:
+            self._auth_failed = True
             raise AuthenticationError("Invalid API key")
         
         if response.status_code == 429:
-            retry_after = response.headers.get("Retry-After")
             raise RateLimitError(
                 "Rate limit exceeded. Please slow down or upgrade your plan.",
-                retry_after=int(retry_after) if retry_after else None
+                retry_after=_retry_after_seconds(response.headers.get("Retry-After")),
             )
         
         if response.status_code == 404:
-            data = response.json() if response.text else {}
+            data = loads(response.content) if response.content else {}
             raise GuardrailNotFoundError(data.get("guardrail_id", "unknown"))
         
         if response.status_code >= 400:
             try:
-                data = response.json()
-                message = data.get("error") or data.get("message") or "API request failed"
-            except Exception:
-                message = response.text or "API request failed"
-            raise APIError(message, status_code=response.status_code, response_body=response.text)
+                data = loads(response.content)
+            except ValueError:
+                data = None
+            raise APIError.from_response(response, data)
         
-        return response.json()
+        result: Dict[str, Any] = loads(response.content)
+        return result
+
+    @classmethod
+    def shared(
+        cls,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "AsyncEthicalZen":
+        """
+        Get a shared client for the given API key and base URL.
+
+        The first call in an event loop constructs the client (passing
+        ``kwargs`` through); later calls in the same loop with the same key
+        and URL return the same instance. Each ``asyncio.run()`` gets its own
+        client, and clients of closed loops are dropped.
+
+        Example:
+            @app.on_event("startup")
+            async def startup():
+                app.state.ethicalzen = AsyncEthicalZen.shared()
+        """
+        resolved_key = api_key or os.environ.get("ETHICALZEN_API_KEY") or ""
+        resolved_url = (
+            base_url or os.environ.get("ETHICALZEN_BASE_URL") or DEFAULT_BASE_URL
+        ).rstrip("/")
+
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        key = (loop, resolved_key, resolved_url)
+
+        with cls._shared_lock:
+            for stale in [k for k in cls._shared if k[0] is not None and k[0].is_closed()]:
+                del cls._shared[stale]
+            client = cls._shared.get(key)
+            if client is None:
+                client = cls(api_key=resolved_key or None, base_url=resolved_url, **kwargs)
+                cls._shared[key] = client
+            return client
+
+    def _evaluation_key(
+        self,
+        guardrail: str,
+        input: str,  # noqa: A002 - using 'input' to match API
+        context: Optional[Dict[str, Any]],
+    ) -> bytes:
+        """Cache key for an evaluation under the guardrail's current configuration."""
+        return evaluation_key(guardrail, input, context, self._guardrail_versions.get(guardrail, 0))
+
+    def _check_known(self, guardrail: Optional[str] = None) -> None:
+        """Fail fast on a rejected API key or a guardrail recently reported missing."""
+        if self._auth_failed:
+            raise AuthenticationError("Invalid API key")
+        if guardrail is not None and self._not_found.get(guardrail):
+            raise GuardrailNotFoundError(guardrail)
+
+    async def _post(self, path: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """POST within the concurrency limit, retrying when rate limited."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        template = self._templates.get(path)
+        if template is None:
+            template = self._templates[path] = _RequestTemplate(self._client, path)
+
+        attempt = 0
+        while True:
+            self._check_known()
+            async with self._semaphore:
+                response = await self._client.send(template.build(dumps(body)))
+            try:
+                return self._handle_response(response)
+            except RateLimitError as e:
+                if attempt >= self.max_retries:
+                    raise
+                if e.retry_after is not None:
+                    delay = e.retry_after
+                else:
+                    delay = min(MAX_RETRY_BACKOFF, RETRY_BACKOFF * 2 ** attempt)
+                attempt += 1
+                # Sleep outside the semaphore so other requests can proceed
+                await asyncio.sleep(delay)
+
+    async def _get(self, path: str) -> Dict[str, Any]:
+        """GET a rarely-changing resource, using the TTL cache and ETags."""
+        self._check_known()
+        data: Optional[Dict[str, Any]] = self._metadata.get(path)
+        if data is not None:
+            return data
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        cached = self._etags.get(path)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        async with self._semaphore:
+            response = await self._client.get(path, headers=headers)
+        data = _conditional_payload(self, path, response)
+        self._metadata.set(path, data)
+        return data
 
     async def evaluate(
         self,
         guardrail: str,
         input: str,  # noqa: A002
         context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
     ) -> EvaluationResult:
-        """Evaluate content against a guardrail (async)."""
-        if not guardrail:
-            raise ValidationError("guardrail is required", field="guardrail")
-        if not input:
-            raise ValidationError("input is required", field="input")
-        if len(input) > MAX_INPUT_LENGTH:
-            raise ValidationError(
-                f"input exceeds maximum length of {MAX_INPUT_LENGTH} characters",
-                field="input"
+        """
+        Evaluate content against a guardrail (async).
+
+        Concurrent calls for the same guardrail, input and context share a
+        single API request when use_cache is enabled.
+        """
+        _validate_evaluation(guardrail, input)
+        self._check_known(guardrail)
+
+        if not use_cache:
+            data = await self._fetch_evaluation(guardrail, input, context)
+            return _build_evaluation_result(data, guardrail)
+
+        key = self._evaluation_key(guardrail, input, context)
+        data = self._cache.get(key)
+        if data is None:
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(
+                    self._fetch_evaluation(guardrail, input, context, key)
+                )
+                self._inflight[key] = task
+                task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            # Shield so one caller's cancellation doesn't cancel the shared request
+            data = await asyncio.shield(task)
+
+        return _build_evaluation_result(data, guardrail)
+
+    async def _fetch_evaluation(
+        self,
+        guardrail: str,
+        input: str,  # noqa: A002
+        context: Optional[Dict[str, Any]],
+        key: Optional[bytes] = None,
+    ) -> Dict[str, Any]:
+        """Call the evaluate endpoint and cache the payload under key."""
+        try:
+            data = await self._post(
+                EVALUATE_PATH,
+                {
+                    "guardrail_id": guardrail,
+                    "input": input,
+                    "context": context,
+                },
             )
+        except GuardrailNotFoundError:
+            self._not_found.set(guardrail, True)
+            raise
+        if key is not None:
+            self._cache.set(key, data)
+        return data
 
-        response = await self._client.post(
-            "/api/sg/evaluate",
-            json={
-                "guardrail_id": guardrail,
-                "input": input,
-                "context": context,
-            },
-        )
+    async def evaluate_many(
+        self,
+        pairs: List[Tuple[str, str]],
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+    ) -> List[EvaluationResult]:
+        """Evaluate many (guardrail, input) pairs at once (async)."""
+        for guardrail, text in pairs:
+            _validate_evaluation(guardrail, text)
+            self._check_known(guardrail)
+
+        if not self.batch:
+            return list(await asyncio.gather(
+                *[self.evaluate(g, i, context, use_cache) for g, i in pairs]
+            ))
         
-        data = self._handle_response(response)
+        # Bound once for the per-pair loops below
+        cache_get = self._cache.get
+        cache_set = self._cache.set
+        keys = [self._evaluation_key(g, i, context) if use_cache else None for g, i in pairs]
+        payloads: List[Any] = [cache_get(k) if k is not None else None for k in keys]
+        missing = [n for n, data in enumerate(payloads) if data is None]
         
-        # Normalize decision to uppercase (API returns lowercase)
-        decision_str = data.get("decision", "ALLOW").upper()
+        if missing:
+            data = await self._post(
+                EVALUATE_BATCH_PATH,
+                {
+                    "items": [
+                        {"guardrail_id": pairs[n][0], "input": pairs[n][1], "context": context}
+                        for n in missing
+                    ],
+                },
+            )
+            for n, item in zip(missing, _batch_results(data, len(missing))):
+                payloads[n] = item
+                if keys[n] is not None:
+                    cache_set(keys[n], item)
         
-        return EvaluationResult(
-            decision=Decision(decision_str),
-            score=data.get("score", 0.0),
-            reason=data.get("reason"),
-            guardrail_id=guardrail,
-            latency_ms=data.get("latency_ms"),
-            metadata=data.get("metadata"),
-        )
+        build = _build_evaluation_result
+        return [build(data, guardrail) for (guardrail, _), data in zip(pairs, payloads)]
 
     async def design(
         self,
@@ -546,17 +1013,16 @@ class AsyncEthicalZen:
         if not description:
             raise ValidationError("description is required", field="description")
 
-        response = await self._client.post(
+        data = await self._post(
             "/api/sg/design",
-            json={
+            {
                 "naturalLanguage": description,
                 "safeExamples": safe_examples or [],
                 "unsafeExamples": unsafe_examples or [],
                 "autoSimulate": auto_simulate,
             },
         )
-        
-        data = self._handle_response(response)
+        _forget_listing(self, GUARDRAILS_PATH)
         
         config_data = data.get("config", data)
         config = GuardrailConfig(
@@ -568,6 +1034,10 @@ class AsyncEthicalZen:
             safe_examples=config_data.get("safeExamples", []),
             unsafe_examples=config_data.get("unsafeExamples", []),
         )
+        if config.id:
+            # The ID may have been reported missing, or evaluated under an
+            # older configuration, before this design
+            _forget_guardrail(self, config.id)
         
         simulation = None
         if data.get("simulation"):
@@ -595,8 +1065,51 @@ class AsyncEthicalZen:
             message=data.get("message"),
         )
 
+    async def list_templates(self) -> List[Template]:
+        """List available guardrail templates (async)."""
+        return _parse_templates(await self._get("/api/sg/templates"))
+
+    async def get_template(self, template_id: str) -> Template:
+        """Get a specific guardrail template with examples (async)."""
+        return _parse_template(await self._get(f"/api/sg/templates/{template_id}"), template_id)
+
+    async def prefetch_templates(self) -> List[Template]:
+        """
+        Fetch every template with its examples concurrently and cache them.
+
+        Later get_template() calls are served from the cache until it expires.
+        """
+        templates = await self.list_templates()
+        return list(await asyncio.gather(*[self.get_template(t.id) for t in templates]))
+
+    async def list_guardrails(self) -> List[GuardrailConfig]:
+        """List all guardrails for the tenant (async)."""
+        return _parse_guardrails(await self._get(GUARDRAILS_PATH))
+
+    async def get_guardrail(self, guardrail: str) -> GuardrailConfig:
+        """Get a specific guardrail configuration (async)."""
+        self._check_known(guardrail)
+
+        # List all and filter by ID (backend doesn't have single-get endpoint)
+        for g in await self.list_guardrails():
+            if g.id == guardrail:
+                return g
+
+        # Not negative-cached: the listing may predate a guardrail created since
+        raise GuardrailNotFoundError(guardrail)
+
+    def clear_cache(self) -> None:
+        """Discard all cached results, listings and remembered missing guardrails."""
+        self._cache.clear()
+        self._not_found.clear()
+        self._metadata.clear()
+        self._etags.clear()
+
     async def close(self) -> None:
         """Close the HTTP client."""
+        with self._shared_lock:
+            for key in [k for k, client in self._shared.items() if client is self]:
+                del self._shared[key]
         await self._client.aclose()
 
     async def __aenter__(self) -> "AsyncEthicalZen":
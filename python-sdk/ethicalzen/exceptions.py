@@ -1,6 +1,6 @@
 """Custom exceptions for EthicalZen SDK."""
 
-from typing import Optional
+from typing import Any, Optional
 
 
 class EthicalZenError(Exception):
@@ -25,7 +25,7 @@ class RateLimitError(EthicalZenError):
     def __init__(
         self, 
         message: str = "Rate limit exceeded", 
-        retry_after: Optional[int] = None
+        retry_after: Optional[float] = None
     ):
         super().__init__(message, status_code=429)
         self.retry_after = retry_after
@@ -43,6 +43,26 @@ class APIError(EthicalZenError):
         super().__init__(message, status_code)
         self.response_body = response_body
 
+    @classmethod
+    def from_response(cls, response: Any, data: Any = None) -> "APIError":
+        """
+        Build an APIError from an error HTTP response.
+
+        Args:
+            response: The httpx response
+            data: The decoded JSON body, if already parsed
+        """
+        message = None
+        if isinstance(data, dict):
+            message = data.get("error") or data.get("message")
+            if isinstance(message, dict):  # OpenAI-style {"error": {"message": ...}}
+                message = message.get("message")
+        return cls(
+            message or response.text or "API request failed",
+            status_code=response.status_code,
+            response_body=response.text,
+        )
+
 
 class ValidationError(EthicalZenError):
     """Raised when input validation fails."""
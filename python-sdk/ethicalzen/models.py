@@ -2,7 +2,7 @@
 
 from enum import Enum
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class Decision(str, Enum):
@@ -12,6 +12,13 @@ class Decision(str, Enum):
     REVIEW = "REVIEW"
 
 
+# Accepts both the API's lowercase decisions and the enum values
+_DECISION_MAP: Dict[str, Decision] = {
+    **{d.value: d for d in Decision},
+    **{d.value.lower(): d for d in Decision},
+}
+
+
 class EvaluationResult(BaseModel):
     """Result of a guardrail evaluation."""
     
@@ -22,6 +29,19 @@ class EvaluationResult(BaseModel):
     latency_ms: Optional[float] = Field(default=None, description="Evaluation latency in milliseconds")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
 
+    # Immutable so results can be shared safely (e.g. between cache hits)
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    @field_validator("decision", mode="before")
+    @classmethod
+    def _normalize_decision(cls, value: Any) -> Any:
+        """Accept lowercase decisions as returned by the API."""
+        decision = _DECISION_MAP.get(value) if isinstance(value, str) else None
+        if decision is not None:
+            return decision
+        # Rare mixed-case values; anything else fails validation as before
+        return value.upper() if isinstance(value, str) else value
+
     @property
     def is_allowed(self) -> bool:
         """Check if content is allowed."""
@@ -0,0 +1,64 @@
+"""Provider profiles for proxied LLM APIs."""
+
+import re
+from typing import FrozenSet, NamedTuple, Optional, Pattern, Tuple
+
+# Gateway statuses worth retrying: rate limiting and transient upstream failures
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+class ProviderProfile(NamedTuple):
+    """Conservative defaults for a target API provider."""
+
+    name: str
+    rpm: Optional[int] = None
+    tpm: Optional[int] = None
+    max_concurrent: Optional[int] = None
+    retry_status_codes: FrozenSet[int] = RETRY_STATUS_CODES
+
+
+GENERIC_PROFILE = ProviderProfile("generic")
+
+# Matched against the target URL's host, first match wins
+PROVIDER_PROFILES: Tuple[Tuple[Pattern[str], ProviderProfile], ...] = (
+    (
+        re.compile(r"\.openai\.azure\.com$"),
+        ProviderProfile("azure-openai", rpm=60, tpm=120_000, max_concurrent=10),
+    ),
+    (
+        re.compile(r"(^|\.)api\.openai\.com$"),
+        ProviderProfile("openai", rpm=60, tpm=150_000, max_concurrent=10),
+    ),
+    (
+        re.compile(r"(^|\.)api\.anthropic\.com$"),
+        # 529 is Anthropic's "overloaded"
+        ProviderProfile(
+            "anthropic",
+            rpm=50,
+            tpm=40_000,
+            max_concurrent=5,
+            retry_status_codes=RETRY_STATUS_CODES | {529},
+        ),
+    ),
+    (
+        re.compile(r"(^|\.)generativelanguage\.googleapis\.com$"),
+        ProviderProfile("google", rpm=60, tpm=120_000, max_concurrent=10),
+    ),
+    (
+        re.compile(r"(^|\.)api\.mistral\.ai$"),
+        ProviderProfile("mistral", rpm=60, tpm=500_000, max_concurrent=10),
+    ),
+    (
+        re.compile(r"(^|\.)api\.cohere\.(ai|com)$"),
+        ProviderProfile("cohere", rpm=40, max_concurrent=5),
+    ),
+)
+
+
+def detect_provider(host: str) -> ProviderProfile:
+    """Return the profile for a target host, or GENERIC_PROFILE."""
+    host = host.lower()
+    for pattern, profile in PROVIDER_PROFILES:
+        if pattern.search(host):
+            return profile
+    return GENERIC_PROFILE
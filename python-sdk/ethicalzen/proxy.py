@@ -35,19 +35,119 @@ Usage:
         print(response.json())
 """
 
+import asyncio
+import functools
+import importlib.util
 import os
-from typing import Any, Dict, List, Optional, Union
+import random
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Literal,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
+from urllib.parse import urlsplit
+
 import httpx
 
+from ethicalzen._json import dumps, loads
+from ethicalzen.cache import DEFAULT_CACHE_TTL, DiskCache, TTLCache, request_key
+from ethicalzen.client import (
+    DEFAULT_MAX_RETRIES,
+    MAX_RETRY_BACKOFF,
+    RETRY_BACKOFF,
+    _retry_after_seconds,
+)
 from ethicalzen.exceptions import (
     APIError,
     AuthenticationError,
     EthicalZenError,
     ValidationError,
 )
-
+from ethicalzen.providers import (
+    GENERIC_PROFILE,
+    RETRY_STATUS_CODES,
+    ProviderProfile,
+    detect_provider,
+)
+from ethicalzen.ratelimit import AsyncRateLimiter, RateLimiter
 
 DEFAULT_GATEWAY_URL = "https://gateway.ethicalzen.ai"
+OPENAI_CHAT_COMPLETIONS_URL = "https://api.openai.com/v1/chat/completions"
+OPENAI_COMPLETIONS_URL = "https://api.openai.com/v1/completions"
+
+# HTTP/2 support for httpx
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection pool sizing. All proxy traffic goes to the single gateway host,
+# so the whole pool is available to it.
+DEFAULT_MAX_CONNECTIONS = 200
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 50
+DEFAULT_KEEPALIVE_EXPIRY = 120.0  # seconds; keep idle connections warm between bursts
+# Fail-open clients talk straight to target hosts; keep a few connections warm
+DIRECT_MAX_KEEPALIVE_CONNECTIONS = 10
+DIRECT_KEEPALIVE_EXPIRY = 60.0
+# Send small gateway POSTs immediately instead of waiting on Nagle's algorithm
+SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+DEFAULT_BATCH_CONCURRENCY = 64
+DEFAULT_PROMPT_BATCH_SIZE = 20  # prompts sent per legacy completions request
+
+# Response headers never written to the disk cache: credentials and cookies
+# meant for one client, and hop-by-hop headers describing one connection
+_UNCACHED_HEADERS = frozenset(
+    {
+        "authorization",
+        "proxy-authorization",
+        "set-cookie",
+        "www-authenticate",
+        "proxy-authenticate",
+        "connection",
+        "keep-alive",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+    }
+)
+
+# Process-wide client shared by proxies that don't bring their own
+_DEFAULT_CLIENT: Optional[httpx.Client] = None
+_DEFAULT_CLIENT_LOCK = threading.Lock()
+
+
+def _default_client() -> httpx.Client:
+    """Return the shared httpx.Client, creating it on first use."""
+    global _DEFAULT_CLIENT
+    with _DEFAULT_CLIENT_LOCK:
+        if _DEFAULT_CLIENT is None or _DEFAULT_CLIENT.is_closed:
+            _DEFAULT_CLIENT = httpx.Client(
+                timeout=60.0,
+                transport=httpx.HTTPTransport(
+                    http2=HTTP2_AVAILABLE,
+                    limits=httpx.Limits(
+                        max_connections=DEFAULT_MAX_CONNECTIONS,
+                        max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+                    ),
+                    retries=DEFAULT_MAX_RETRIES,
+                    socket_options=SOCKET_OPTIONS,
+                ),
+            )
+        return _DEFAULT_CLIENT
 
 
 class ProxyResponse:
@@ -90,8 +190,7 @@ class ProxyResponse:
     def text(self) -> str:
         """Get response as text."""
         if isinstance(self._data, (dict, list)):
-            import json
-            return json.dumps(self._data)
+            return dumps(self._data).decode("utf-8")
         return str(self._data)
     
     @property
@@ -99,15 +198,37 @@ class ProxyResponse:
         """Check if response is successful (2xx) and not blocked."""
         return 200 <= self.status_code < 300 and not self.blocked
     
-    # OpenAI-compatible convenience properties
-    @property
-    def choices(self) -> List[Dict]:
+    # OpenAI-compatible convenience properties, parsed on first access
+    @functools.cached_property
+    def choices(self) -> List[Dict[str, Any]]:
         """Get choices from OpenAI-style response."""
         if isinstance(self._data, dict):
-            return self._data.get("choices", [])
+            choices: List[Dict[str, Any]] = self._data.get("choices", [])
+            return choices
         return []
     
-    @property
+    @functools.cached_property
+    def usage(self) -> Optional[Dict[str, Any]]:
+        """Get token usage from OpenAI-style response."""
+        if isinstance(self._data, dict):
+            return self._data.get("usage")
+        return None
+
+    @functools.cached_property
+    def model(self) -> Optional[str]:
+        """Get the model that produced an OpenAI-style response."""
+        if isinstance(self._data, dict):
+            return self._data.get("model")
+        return None
+
+    @functools.cached_property
+    def id(self) -> Optional[str]:
+        """Get the completion ID from OpenAI-style response."""
+        if isinstance(self._data, dict):
+            return self._data.get("id")
+        return None
+
+    @functools.cached_property
     def content(self) -> str:
         """Get content from first choice (OpenAI-style)."""
         if self.blocked:
@@ -135,7 +256,449 @@ class ProxyResponse:
         return f"<ProxyResponse status={self.status_code} ok={self.ok}>"
 
 
-class EthicalZenProxy:
+def _retry_delay(
+    response: httpx.Response,
+    attempt: int,
+    max_retries: int,
+    retry_status_codes: FrozenSet[int] = RETRY_STATUS_CODES,
+) -> Optional[float]:
+    """Seconds to wait before retrying a gateway response, or None to stop."""
+    if response.status_code not in retry_status_codes or attempt >= max_retries:
+        return None
+    retry_after = _retry_after_seconds(response.headers.get("Retry-After"))
+    if retry_after is not None:
+        return retry_after
+    return min(MAX_RETRY_BACKOFF, RETRY_BACKOFF * 2.0**attempt) + random.random() * 0.25
+
+
+def _origin(url: str) -> str:
+    """Return the scheme://host[:port] part of a URL."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _direct_limits() -> httpx.Limits:
+    """Pool limits for fail-open clients."""
+    return httpx.Limits(
+        max_keepalive_connections=DIRECT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=DIRECT_KEEPALIVE_EXPIRY,
+    )
+
+
+def _prompt_batches(prompts: List[str], batch_size: int) -> List[List[str]]:
+    """Split prompts into consecutive batches of at most batch_size."""
+    if batch_size < 1:
+        raise ValidationError("batch_size must be at least 1", field="batch_size")
+    return [prompts[i:i + batch_size] for i in range(0, len(prompts), batch_size)]
+
+
+def _flatten_choices(
+    responses: List[ProxyResponse],
+    batches: List[List[str]],
+    n: int,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Map choices from batched completions back to their prompts.
+
+    OpenAI numbers choices across the whole prompt list, so the choice at
+    ``index`` belongs to prompt ``index // n`` of its batch. Only the first
+    choice of each prompt is kept.
+    """
+    results: List[Optional[Dict[str, Any]]] = []
+    for response, batch in zip(responses, batches):
+        if not response.blocked and not response.ok:
+            raise APIError.from_response(response, response.data)
+        slots: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+        if not response.blocked:
+            for choice in response.choices:
+                slot = choice.get("index", 0) // n
+                if slot < len(slots) and slots[slot] is None:
+                    slots[slot] = choice
+        results.extend(slots)
+    return results
+
+
+_UNDECODABLE = object()
+
+
+def _decode_body(response: httpx.Response) -> Any:
+    """Decode a JSON response body once, or return _UNDECODABLE."""
+    try:
+        return loads(response.content)
+    except ValueError:
+        return _UNDECODABLE
+
+
+def _gateway_response(response: httpx.Response) -> ProxyResponse:
+    """Build a ProxyResponse from a gateway response."""
+    # Check for auth errors
+    if response.status_code == 401:
+        raise AuthenticationError("Invalid API key")
+
+    resp_data = _decode_body(response)
+
+    # Check for blocked response
+    if response.status_code == 403:
+        if not isinstance(resp_data, dict):
+            resp_data = {"message": response.text}
+
+        return ProxyResponse(
+            status_code=403,
+            data=resp_data,
+            headers=dict(response.headers),
+            blocked=True,
+            block_reason=(
+                resp_data.get("reason") or resp_data.get("message") or "Request blocked by guardrail"
+            ),
+            guardrail_id=resp_data.get("guardrail_id"),
+            score=resp_data.get("score"),
+            raw_response=response,
+        )
+
+    if resp_data is _UNDECODABLE:
+        resp_data = response.text
+
+    # Check if response was blocked (output validation)
+    if isinstance(resp_data, dict) and resp_data.get("blocked"):
+        return ProxyResponse(
+            status_code=response.status_code,
+            data=resp_data,
+            headers=dict(response.headers),
+            blocked=True,
+            block_reason=resp_data.get("reason") or "Output blocked by guardrail",
+            guardrail_id=resp_data.get("guardrail_id"),
+            score=resp_data.get("score"),
+            raw_response=response,
+        )
+
+    return ProxyResponse(
+        status_code=response.status_code,
+        data=resp_data,
+        headers=dict(response.headers),
+        blocked=False,
+        raw_response=response,
+    )
+
+
+def _direct_response(response: httpx.Response) -> ProxyResponse:
+    """Build a ProxyResponse from a direct (fail-open) response."""
+    data = _decode_body(response)
+    if data is _UNDECODABLE:
+        data = response.text
+    return ProxyResponse(
+        status_code=response.status_code,
+        data=data,
+        headers=dict(response.headers),
+        blocked=False,
+        raw_response=response,
+    )
+
+
+def _stream_event(line: str) -> Tuple[Optional[str], bool]:
+    """
+    Parse one server-sent event line from a streamed chat completion.
+
+    Returns the content delta (if any) and whether the stream is finished.
+    """
+    if not line.startswith("data:"):
+        return None, False
+    data = line[5:].strip()
+    if data == "[DONE]":
+        return None, True
+    try:
+        chunk = loads(data)
+    except ValueError:
+        return None, False
+    if not isinstance(chunk, dict):
+        return None, False
+    # The gateway ends the stream with a block event if the output is rejected
+    if chunk.get("blocked"):
+        return f"[BLOCKED] {chunk.get('reason') or 'Output blocked by guardrail'}", True
+    choices = chunk.get("choices") or [{}]
+    delta = choices[0].get("delta") or {}
+    return delta.get("content") or None, False
+
+
+def _stream_fallback(response: httpx.Response) -> str:
+    """Content of a read, non-streamed response to a streaming request."""
+    result = _gateway_response(response)
+    if not result.blocked and not result.ok:
+        raise APIError.from_response(response, result.data)
+    return result.content
+
+
+def _stored_response(entry: Any) -> Optional[ProxyResponse]:
+    """Rebuild a ProxyResponse saved by the disk cache, or None if the entry is malformed."""
+    try:
+        return ProxyResponse(entry["status_code"], entry["data"], dict(entry["headers"]))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _is_event_stream(response: Any) -> bool:
+    """Whether the gateway is streaming the (httpx or aiohttp) response as server-sent events."""
+    content_type: str = response.headers.get("content-type", "")
+    return content_type.startswith("text/event-stream")
+
+
+class _ProxyBase:
+    """Configuration and gateway request building shared by the proxy clients."""
+
+    _limiter_class: ClassVar[Type[Any]] = RateLimiter
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        certificate_id: Optional[str] = None,
+        gateway_url: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        timeout: float = 60.0,
+        fail_open: bool = False,
+        *,
+        cache: Optional[MutableMapping[Any, Any]] = None,
+        cache_size: int = 0,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        exact_match_only: bool = True,
+        cache_dir: Optional[str] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        max_concurrent: Optional[int] = None,
+        provider_limits: bool = False,
+    ):
+        self.api_key = api_key or os.environ.get("ETHICALZEN_API_KEY")
+        if not self.api_key:
+            raise AuthenticationError(
+                "API key required. Pass api_key or set ETHICALZEN_API_KEY environment variable."
+            )
+
+        self.certificate_id = certificate_id or os.environ.get("ETHICALZEN_CERTIFICATE_ID")
+        self.gateway_url = (
+            gateway_url or
+            os.environ.get("ETHICALZEN_GATEWAY_URL") or
+            DEFAULT_GATEWAY_URL
+        ).rstrip("/")
+        self.tenant_id = tenant_id or os.environ.get("ETHICALZEN_TENANT_ID")
+        self._proxy_endpoint = f"{self.gateway_url}/api/proxy"
+        self.timeout = timeout
+        self.fail_open = fail_open
+        self.max_retries = max_retries
+        self.provider_limits = provider_limits
+
+        self._limiter = self._limiter_class(rpm=rpm, tpm=tpm, max_concurrent=max_concurrent)
+        # Detected provider, and its limiter when provider_limits is on, by target origin
+        self._profiles: Dict[str, ProviderProfile] = {}
+        self._provider_limiters: Dict[str, Any] = {}
+        # Requests to a new provider may arrive from many threads at once; all
+        # of them must share one limiter or the provider's limits are multiplied
+        self._provider_limiters_lock = threading.Lock()
+
+        self._cache: MutableMapping[Any, Any] = (
+            cache if cache is not None else TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        )
+        # A TTLCache with maxsize 0 is disabled; any other mapping is used as given
+        self._memory_cache = getattr(self._cache, "maxsize", 1) > 0
+        self.exact_match_only = exact_match_only
+        self._disk_cache = DiskCache(cache_dir, ttl=cache_ttl) if cache_dir else None
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._stats_lock = threading.Lock()
+
+        # Gateway headers that are the same for every request
+        self._base_headers = {
+            "Content-Type": "application/json",
+            "X-API-Key": self.api_key,
+        }
+        if self.certificate_id:
+            self._base_headers["X-Contract-ID"] = self.certificate_id
+        if self.tenant_id:
+            self._base_headers["X-Tenant-ID"] = self.tenant_id
+        # "Bearer ..." values, by target API key
+        self._auth_cache: Dict[str, str] = {}
+        # Guardrail decisions depend on who the gateway evaluates for, so caches
+        # shared between proxies (cache=, cache_dir=) must keep them apart
+        self._key_scope: Dict[str, Optional[str]] = {
+            "gateway_url": self.gateway_url,
+            "api_key": self.api_key,
+            "tenant_id": self.tenant_id,
+        }
+
+    def _request_key(
+        self,
+        method: str,
+        url: str,
+        json: Optional[Any],
+        data: Optional[Any],
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+    ) -> Optional[bytes]:
+        """Return a key identifying a request, or None if identical requests may differ."""
+        if self.exact_match_only:
+            # Only deterministic calls: GETs, or LLM calls pinned to temperature 0
+            if isinstance(json, dict) and "temperature" in json:
+                if json["temperature"] != 0:
+                    return None
+            elif method.upper() not in ("GET", "HEAD"):
+                return None
+        body = {"json": json, "data": data, "params": params}
+        return request_key(method, url, body, self.certificate_id, headers, self._key_scope)
+
+    def _cache_key(
+        self,
+        method: str,
+        url: str,
+        json: Optional[Any],
+        data: Optional[Any],
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+    ) -> Optional[bytes]:
+        """Return the cache key for a request, or None if it must not be cached."""
+        if not self._memory_cache and not self._persistent(json):
+            return None
+        return self._request_key(method, url, json, data, headers, params)
+
+    def _persistent(self, json: Optional[Any]) -> bool:
+        """Whether a request's response may be cached on disk: temperature 0, not streamed."""
+        return (
+            self._disk_cache is not None
+            and isinstance(json, dict)
+            and json.get("temperature", 1) == 0
+            and not json.get("stream")
+        )
+
+    def _cached(self, key: bytes, json: Optional[Any]) -> Optional[ProxyResponse]:
+        """Return the cached response for key from memory, then disk, counting hits and misses."""
+        persistent = self._persistent(json)
+        if not self._memory_cache and not persistent:
+            return None
+        response = self._cache.get(key)
+        if response is None and persistent and self._disk_cache is not None:
+            response = _stored_response(self._disk_cache.get(key))
+            if response is not None:
+                self._cache[key] = response
+        with self._stats_lock:
+            if response is None:
+                self._cache_misses += 1
+            else:
+                self._cache_hits += 1
+        return response
+
+    def _cache_response(
+        self,
+        key: Optional[bytes],
+        response: ProxyResponse,
+        json: Optional[Any] = None,
+    ) -> None:
+        """Cache a successful, unblocked response."""
+        if key is None or not response.ok:
+            return
+        self._cache[key] = response
+        if self._persistent(json) and self._disk_cache is not None:
+            self._disk_cache.set(key, {
+                "status_code": response.status_code,
+                "data": response.data,
+                "headers": {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower() not in _UNCACHED_HEADERS
+                },
+            })
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return the number of cache hits and misses so far."""
+        with self._stats_lock:
+            return {"hits": self._cache_hits, "misses": self._cache_misses}
+
+    def clear_cache(self) -> None:
+        """Discard all cached responses, including those on disk."""
+        self._cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
+
+    def _profile(self, url: str) -> ProviderProfile:
+        """Return the provider profile for the target url, detected once per origin."""
+        origin = _origin(url)
+        profile = self._profiles.get(origin)
+        if profile is None:
+            profile = self._profiles[origin] = detect_provider(urlsplit(url).hostname or "")
+        return profile
+
+    def _limiter_for(self, profile: ProviderProfile) -> Any:
+        """Return the rate limiter for requests to a provider."""
+        if not self.provider_limits or profile is GENERIC_PROFILE:
+            return self._limiter
+        limiter = self._provider_limiters.get(profile.name)
+        if limiter is None:
+            with self._provider_limiters_lock:
+                limiter = self._provider_limiters.get(profile.name)
+                if limiter is None:
+                    limiter = self._provider_limiters[profile.name] = self._limiter_class(
+                        rpm=self._limiter.rpm or profile.rpm,
+                        tpm=self._limiter.tpm or profile.tpm,
+                        max_concurrent=self._limiter.max_concurrent or profile.max_concurrent,
+                    )
+        return limiter
+
+    def _gateway_headers(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        profile: ProviderProfile,
+    ) -> Dict[str, str]:
+        """Build gateway headers for a request to the target url."""
+        gateway_headers = self._base_headers.copy()
+        gateway_headers["X-Target-Endpoint"] = url
+        gateway_headers["X-Target-Method"] = method.upper()
+        gateway_headers["X-EthicalZen-Provider"] = profile.name
+
+        # Pass through target headers (like Authorization)
+        if headers:
+            for key, value in headers.items():
+                # Pass auth headers directly
+                if key.lower() in ("authorization", "x-api-key", "api-key"):
+                    gateway_headers[key] = value
+                else:
+                    # Prefix other headers to avoid conflicts
+                    gateway_headers[f"X-Target-Header-{key}"] = value
+
+        return gateway_headers
+
+    @staticmethod
+    def _gateway_content(
+        json: Optional[Any],
+        data: Optional[Any],
+        params: Optional[Dict[str, Any]],
+    ) -> Optional[bytes]:
+        """Build the encoded gateway request body, or None when there is nothing to send."""
+        gateway_body: Dict[str, Any] = {}
+        if json is not None:
+            gateway_body = json if isinstance(json, dict) else {"_body": json}
+        elif data is not None:
+            gateway_body = {"_raw_data": data}
+
+        if params:
+            gateway_body["_query_params"] = params
+
+        return dumps(gateway_body) if gateway_body else None
+
+    def _chat_headers(
+        self,
+        target_api_key: Optional[str],
+        headers: Optional[Dict[str, str]],
+    ) -> Optional[Dict[str, str]]:
+        """Add a bearer Authorization header for the target API key, if given."""
+        if target_api_key is None:
+            return headers
+        auth = self._auth_cache.get(target_api_key)
+        if auth is None:
+            auth = self._auth_cache[target_api_key] = f"Bearer {target_api_key}"
+        if not headers:
+            return {"Authorization": auth}
+        return {**headers, "Authorization": auth}
+
+
+class EthicalZenProxy(_ProxyBase):
     """
     Proxy client that routes ANY HTTP API calls through EthicalZen gateway.
     
@@ -178,6 +741,21 @@ class EthicalZenProxy:
         tenant_id: Optional[str] = None,
         timeout: float = 60.0,
         fail_open: bool = False,
+        http2: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        client: Optional[httpx.Client] = None,
+        cache_size: int = 0,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        exact_match_only: bool = True,
+        cache: Optional[MutableMapping[Any, Any]] = None,
+        cache_dir: Optional[str] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        max_concurrent: Optional[int] = None,
+        provider_limits: bool = False,
     ):
         """
         Initialize the proxy client.
@@ -189,24 +767,62 @@ class EthicalZenProxy:
             tenant_id: Your tenant ID (optional, derived from API key)
             timeout: Request timeout in seconds
             fail_open: If True, allow requests through on gateway error. Default False (fail-closed).
+            http2: Multiplex requests over HTTP/2 when the ``h2`` package is installed
+            max_connections: Maximum open connections to the gateway
+            max_keepalive_connections: Maximum idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept alive
+            client: Existing httpx.Client to send requests with. It is not closed
+                by close(), and the connection pool arguments above are ignored.
+            cache_size: Maximum number of cached responses. 0 (default) disables caching.
+            cache_ttl: Seconds a cached response stays valid. Default is 300s.
+            exact_match_only: Only cache deterministic requests: GETs, and
+                requests whose JSON body sets temperature to 0. Default True.
+            cache: Mapping to cache responses in instead of a new TTLCache, e.g. a
+                dict or a TTLCache shared between proxies. It is used as given:
+                cache_size and cache_ttl don't apply to it.
+            cache_dir: Directory to also cache responses in across restarts, for
+                cache_ttl seconds. Only requests whose JSON body sets temperature
+                to 0 and isn't streamed are stored there. See clear_cache().
+            max_retries: Retries on 429/502/503/504, honoring Retry-After, and
+                on connection failures. Default is 3.
+            rpm: Maximum requests sent per minute (client-side)
+            tpm: Maximum estimated LLM tokens sent per minute (client-side)
+            max_concurrent: Maximum requests in flight at once
+            provider_limits: Also apply the detected provider's default rpm, tpm and
+                concurrency limits (see ethicalzen.providers), per provider
         """
-        self.api_key = api_key or os.environ.get("ETHICALZEN_API_KEY")
-        if not self.api_key:
-            raise AuthenticationError(
-                "API key required. Pass api_key or set ETHICALZEN_API_KEY environment variable."
-            )
+        super().__init__(
+            api_key, certificate_id, gateway_url, tenant_id, timeout, fail_open,
+            cache=cache, cache_size=cache_size, cache_ttl=cache_ttl,
+            exact_match_only=exact_match_only, cache_dir=cache_dir, max_retries=max_retries,
+            rpm=rpm, tpm=tpm, max_concurrent=max_concurrent,
+            provider_limits=provider_limits,
+        )
         
-        self.certificate_id = certificate_id or os.environ.get("ETHICALZEN_CERTIFICATE_ID")
-        self.gateway_url = (
-            gateway_url or 
-            os.environ.get("ETHICALZEN_GATEWAY_URL") or 
-            DEFAULT_GATEWAY_URL
-        ).rstrip("/")
-        self.tenant_id = tenant_id or os.environ.get("ETHICALZEN_TENANT_ID")
-        self.timeout = timeout
-        self.fail_open = fail_open
+        self._http2 = http2 and HTTP2_AVAILABLE
+        # Fail-open clients, one per target origin
+        self._direct_clients: Dict[str, httpx.Client] = {}
+        self._direct_lock = threading.Lock()
         
-        self._client = httpx.Client(timeout=timeout)
+        self._owns_client = client is None
+        if client is not None:
+            self._client = client
+        else:
+            # Pool settings go on the transport; httpx ignores client-level
+            # limits and http2 once a transport is given
+            self._client = httpx.Client(
+                timeout=timeout,
+                transport=httpx.HTTPTransport(
+                    http2=self._http2,
+                    limits=httpx.Limits(
+                        max_connections=max_connections,
+                        max_keepalive_connections=max_keepalive_connections,
+                        keepalive_expiry=keepalive_expiry,
+                    ),
+                    retries=max_retries,
+                    socket_options=SOCKET_OPTIONS,
+                ),
+            )
     
     def request(
         self,
@@ -234,94 +850,42 @@ class EthicalZenProxy:
         Returns:
             ProxyResponse with response data or block information
         """
-        # Build gateway headers
-        gateway_headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": self.api_key,
-            "X-Target-Endpoint": url,
-            "X-Target-Method": method.upper(),
-        }
-        
-        if self.certificate_id:
-            gateway_headers["X-Contract-ID"] = self.certificate_id
-        if self.tenant_id:
-            gateway_headers["X-Tenant-ID"] = self.tenant_id
+        key = self._cache_key(method, url, json, data, headers, params)
+        if key is not None:
+            cached = self._cached(key, json)
+            if cached is not None:
+                return cached
         
-        # Pass through target headers (like Authorization)
-        if headers:
-            for key, value in headers.items():
-                # Pass auth headers directly
-                if key.lower() in ("authorization", "x-api-key", "api-key"):
-                    gateway_headers[key] = value
-                else:
-                    # Prefix other headers to avoid conflicts
-                    gateway_headers[f"X-Target-Header-{key}"] = value
+        profile = self._profile(url)
+        limiter = self._limiter_for(profile)
+        gateway_headers = self._gateway_headers(method, url, headers, profile)
+        gateway_content = self._gateway_content(json, data, params)
         
-        # Build request body for gateway
-        gateway_body: Dict[str, Any] = {}
-        if json is not None:
-            gateway_body = json if isinstance(json, dict) else {"_body": json}
-        elif data is not None:
-            gateway_body = {"_raw_data": data}
-        
-        if params:
-            gateway_body["_query_params"] = params
+        tokens = limiter.tokens_for(json)
         
         try:
-            response = self._client.post(
-                f"{self.gateway_url}/api/proxy",
-                headers=gateway_headers,
-                json=gateway_body if gateway_body else None,
-            )
-            
-            # Check for blocked response
-            if response.status_code == 403:
+            attempt = 0
+            while True:
+                limiter.acquire(tokens)
                 try:
-                    resp_data = response.json()
-                except Exception:
-                    resp_data = {"message": response.text}
-                    
-                return ProxyResponse(
-                    status_code=403,
-                    data=resp_data,
-                    headers=dict(response.headers),
-                    blocked=True,
-                    block_reason=resp_data.get("reason") or resp_data.get("message") or "Request blocked by guardrail",
-                    guardrail_id=resp_data.get("guardrail_id"),
-                    score=resp_data.get("score"),
-                    raw_response=response,
-                )
-            
-            # Check for auth errors
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid API key")
-            
-            # Parse response
-            try:
-                resp_data = response.json()
-            except Exception:
-                resp_data = response.text
-            
-            # Check if response was blocked (output validation)
-            if isinstance(resp_data, dict) and resp_data.get("blocked"):
-                return ProxyResponse(
-                    status_code=response.status_code,
-                    data=resp_data,
-                    headers=dict(response.headers),
-                    blocked=True,
-                    block_reason=resp_data.get("reason") or "Output blocked by guardrail",
-                    guardrail_id=resp_data.get("guardrail_id"),
-                    score=resp_data.get("score"),
-                    raw_response=response,
+                    response = self._client.post(
+                        self._proxy_endpoint,
+                        headers=gateway_headers,
+                        content=gateway_content,
+                        timeout=self.timeout,
+                    )
+                finally:
+                    limiter.release()
+                delay = _retry_delay(
+                    response, attempt, self.max_retries, profile.retry_status_codes
                 )
-            
-            return ProxyResponse(
-                status_code=response.status_code,
-                data=resp_data,
-                headers=dict(response.headers),
-                blocked=False,
-                raw_response=response,
-            )
+                if delay is None:
+                    break
+                attempt += 1
+                time.sleep(delay)
+            result = _gateway_response(response)
+            self._cache_response(key, result, json)
+            return result
             
         except httpx.TimeoutException:
             if self.fail_open:
@@ -340,18 +904,22 @@ class EthicalZenProxy:
         **kwargs: Any,
     ) -> ProxyResponse:
         """Make a direct request (bypass gateway) for fail-open mode."""
-        response = self._client.request(method, url, **kwargs)
-        try:
-            data = response.json()
-        except Exception:
-            data = response.text
-        return ProxyResponse(
-            status_code=response.status_code,
-            data=data,
-            headers=dict(response.headers),
-            blocked=False,
-            raw_response=response,
-        )
+        response = self._direct_client(url).request(method, url, **kwargs)
+        return _direct_response(response)
+
+    def _direct_client(self, url: str) -> httpx.Client:
+        """Return the fail-open client for the URL's origin, creating it on first use."""
+        origin = _origin(url)
+        client = self._direct_clients.get(origin)
+        if client is None:
+            with self._direct_lock:
+                client = self._direct_clients.get(origin)
+                if client is None:
+                    client = httpx.Client(
+                        timeout=self.timeout, http2=self._http2, limits=_direct_limits()
+                    )
+                    self._direct_clients[origin] = client
+        return client
     
     # Convenience methods for common HTTP methods
     def get(self, url: str, **kwargs: Any) -> ProxyResponse:
@@ -374,9 +942,187 @@ class EthicalZenProxy:
         """Send a DELETE request through the gateway."""
         return self.request("DELETE", url, **kwargs)
     
+    @overload
+    def chat_completions(
+        self,
+        *,
+        target_api_key: Optional[str] = ...,
+        url: str = ...,
+        headers: Optional[Dict[str, str]] = ...,
+        stream: Literal[False] = ...,
+        **body: Any,
+    ) -> ProxyResponse: ...
+
+    @overload
+    def chat_completions(
+        self,
+        *,
+        target_api_key: Optional[str] = ...,
+        url: str = ...,
+        headers: Optional[Dict[str, str]] = ...,
+        stream: Literal[True],
+        **body: Any,
+    ) -> Iterator[str]: ...
+
+    def chat_completions(
+        self,
+        *,
+        target_api_key: Optional[str] = None,
+        url: str = OPENAI_CHAT_COMPLETIONS_URL,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        **body: Any,
+    ) -> Union[ProxyResponse, Iterator[str]]:
+        """
+        Create an OpenAI-style chat completion through the gateway.
+
+        Args:
+            target_api_key: API key for the target LLM, sent as a bearer token
+            url: Chat completions endpoint (defaults to OpenAI)
+            headers: Extra headers for the target API
+            **body: Request body, e.g. model="gpt-4", messages=[...]
+
+        Returns:
+            ProxyResponse, or with stream=True an iterator of content deltas.
+            A blocked stream ends with a "[BLOCKED] reason" item.
+        """
+        headers = self._chat_headers(target_api_key, headers)
+        if stream:
+            return self._stream_chat(url, {**body, "stream": True}, headers)
+        return self.post(url, json=body, headers=headers)
+
+    def _stream_chat(
+        self,
+        url: str,
+        body: Dict[str, Any],
+        headers: Optional[Dict[str, str]],
+    ) -> Iterator[str]:
+        """Stream a chat completion, yielding content deltas as they arrive."""
+        profile = self._profile(url)
+        limiter = self._limiter_for(profile)
+        gateway_headers = self._gateway_headers("POST", url, headers, profile)
+        gateway_headers["Accept"] = "text/event-stream"
+        gateway_content = self._gateway_content(body, None, None)
+
+        limiter.acquire(limiter.tokens_for(body))
+        try:
+            with self._client.stream(
+                "POST",
+                self._proxy_endpoint,
+                headers=gateway_headers,
+                content=gateway_content,
+                timeout=self.timeout,
+            ) as response:
+                if not _is_event_stream(response):
+                    response.read()
+                    yield _stream_fallback(response)
+                    return
+                for line in response.iter_lines():
+                    text, done = _stream_event(line)
+                    if text:
+                        yield text
+                    if done:
+                        break
+        except httpx.TimeoutException:
+            raise EthicalZenError("Gateway request timed out", status_code=408)
+        except httpx.RequestError as e:
+            raise EthicalZenError(f"Gateway connection error: {e}")
+        finally:
+            limiter.release()
+
+    def batch_chat_completions(
+        self,
+        requests: List[Dict[str, Any]],
+        *,
+        target_api_key: Optional[str] = None,
+        url: str = OPENAI_CHAT_COMPLETIONS_URL,
+        headers: Optional[Dict[str, str]] = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> List[Union[ProxyResponse, BaseException]]:
+        """
+        Send many chat completions concurrently from a thread pool.
+
+        Args:
+            requests: Request bodies, one per completion
+            target_api_key: API key for the target LLM, shared by all requests
+            url: Chat completions endpoint (defaults to OpenAI)
+            headers: Extra headers for the target API
+            max_concurrency: Maximum requests in flight at once
+
+        Returns:
+            List in the same order as ``requests``, holding a ProxyResponse or
+            the exception raised for that request
+        """
+        if not requests:
+            return []
+        chat_headers = self._chat_headers(target_api_key, headers)
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(requests))) as executor:
+            futures = [
+                executor.submit(self.post, url, json=r, headers=chat_headers)
+                for r in requests
+            ]
+            return [f.exception() or f.result() for f in futures]
+
+    def completions(
+        self,
+        prompt: Union[str, List[str]],
+        *,
+        target_api_key: Optional[str] = None,
+        url: str = OPENAI_COMPLETIONS_URL,
+        headers: Optional[Dict[str, str]] = None,
+        **body: Any,
+    ) -> ProxyResponse:
+        """
+        Create an OpenAI-style (legacy) completion through the gateway.
+
+        Args:
+            prompt: A prompt, or a list of prompts sent in one request
+            target_api_key: API key for the target LLM, sent as a bearer token
+            url: Completions endpoint (defaults to OpenAI)
+            headers: Extra headers for the target API
+            **body: Other request fields, e.g. model="gpt-3.5-turbo-instruct"
+        """
+        return self.post(
+            url,
+            json={**body, "prompt": prompt},
+            headers=self._chat_headers(target_api_key, headers),
+        )
+
+    def completions_many(
+        self,
+        prompts: List[str],
+        *,
+        batch_size: int = DEFAULT_PROMPT_BATCH_SIZE,
+        **kwargs: Any,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Complete many prompts, sending up to ``batch_size`` prompts per request.
+
+        Args:
+            prompts: Prompts to complete
+            batch_size: Prompts per request
+            **kwargs: Arguments for completions(), shared by every prompt
+
+        Returns:
+            One choice dict per prompt, in order. Prompts whose batch was
+            blocked have None. With ``n`` > 1 only each prompt's first choice
+            is returned; call completions() to get all of them.
+
+        Raises:
+            APIError: If a batch failed without being blocked, e.g. a 400, or
+                a 429 after retries ran out
+        """
+        batches = _prompt_batches(prompts, batch_size)
+        responses = [self.completions(batch, **kwargs) for batch in batches]
+        return _flatten_choices(responses, batches, kwargs.get("n", 1))
+
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
+        """Close the HTTP client, unless it was passed in."""
+        if self._owns_client:
+            self._client.close()
+        for client in self._direct_clients.values():
+            client.close()
+        self._direct_clients.clear()
     
     def __enter__(self) -> "EthicalZenProxy":
         return self
@@ -385,12 +1131,380 @@ class EthicalZenProxy:
         self.close()
 
 
+class AsyncEthicalZenProxy(_ProxyBase):
+    """
+    Asynchronous proxy client for routing API calls through the EthicalZen gateway.
+
+    Many requests can be in flight at once, multiplexed over a shared
+    connection pool (HTTP/2 when the ``h2`` package is installed).
+
+    Usage:
+        async with AsyncEthicalZenProxy(certificate_id="dc_my_app") as proxy:
+            responses = await proxy.batch_chat_completions(
+                [{"model": "gpt-4", "messages": [{"role": "user", "content": p}]}
+                 for p in prompts],
+                target_api_key="sk-openai-key",
+            )
+    """
+
+    _limiter_class = AsyncRateLimiter
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        certificate_id: Optional[str] = None,
+        gateway_url: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        timeout: float = 60.0,
+        fail_open: bool = False,
+        http2: bool = True,
+        max_connections: int = 1000,
+        max_keepalive_connections: int = 100,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        cache_size: int = 0,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        exact_match_only: bool = True,
+        cache: Optional[MutableMapping[Any, Any]] = None,
+        cache_dir: Optional[str] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        max_concurrent: Optional[int] = None,
+        provider_limits: bool = False,
+    ):
+        """Initialize the async proxy client. Arguments are the same as EthicalZenProxy."""
+        super().__init__(
+            api_key, certificate_id, gateway_url, tenant_id, timeout, fail_open,
+            cache=cache, cache_size=cache_size, cache_ttl=cache_ttl,
+            exact_match_only=exact_match_only, cache_dir=cache_dir, max_retries=max_retries,
+            rpm=rpm, tpm=tpm, max_concurrent=max_concurrent,
+            provider_limits=provider_limits,
+        )
+
+        self._http2 = http2 and HTTP2_AVAILABLE
+        self._client = self._create_client(
+            httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            )
+        )
+        # Requests currently in flight, keyed like the cache (single-flight)
+        self._inflight: Dict[bytes, "asyncio.Future[ProxyResponse]"] = {}
+        # Fail-open clients, one per target origin
+        self._direct_clients: Dict[str, httpx.AsyncClient] = {}
+
+    def _create_client(self, limits: httpx.Limits) -> Any:
+        """Create the client used to talk to the gateway."""
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            transport=httpx.AsyncHTTPTransport(
+                http2=self._http2,
+                limits=limits,
+                retries=self.max_retries,
+                socket_options=SOCKET_OPTIONS,
+            ),
+        )
+
+    async def _gateway_post(
+        self, headers: Dict[str, str], content: Optional[bytes]
+    ) -> httpx.Response:
+        """POST an encoded request to the gateway."""
+        response: httpx.Response = await self._client.post(
+            self._proxy_endpoint,
+            headers=headers,
+            content=content,
+        )
+        return response
+
+    async def _gateway_stream(
+        self,
+        headers: Dict[str, str],
+        content: Optional[bytes],
+    ) -> AsyncIterator[str]:
+        """POST an encoded streaming request to the gateway, yielding content deltas."""
+        async with self._client.stream(
+            "POST",
+            self._proxy_endpoint,
+            headers=headers,
+            content=content,
+        ) as response:
+            if not _is_event_stream(response):
+                await response.aread()
+                yield _stream_fallback(response)
+                return
+            async for line in response.aiter_lines():
+                text, done = _stream_event(line)
+                if text:
+                    yield text
+                if done:
+                    break
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> ProxyResponse:
+        """Send an HTTP request through the EthicalZen gateway (async)."""
+        key = self._request_key(method, url, json, data, headers, params)
+        if key is None:
+            return await self._send(method, url, json, data, headers, params, None)
+
+        cached = self._cached(key, json)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send(method, url, json, data, headers, params, key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller's cancellation doesn't cancel the shared request
+        return await asyncio.shield(task)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        json: Optional[Any],
+        data: Optional[Any],
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+        key: Optional[bytes],
+    ) -> ProxyResponse:
+        """Send one request to the gateway, caching the response under key."""
+        profile = self._profile(url)
+        limiter = self._limiter_for(profile)
+        gateway_headers = self._gateway_headers(method, url, headers, profile)
+        gateway_content = self._gateway_content(json, data, params)
+
+        tokens = limiter.tokens_for(json)
+
+        try:
+            attempt = 0
+            while True:
+                await limiter.acquire(tokens)
+                try:
+                    response = await self._gateway_post(gateway_headers, gateway_content)
+                finally:
+                    limiter.release()
+                delay = _retry_delay(
+                    response, attempt, self.max_retries, profile.retry_status_codes
+                )
+                if delay is None:
+                    break
+                attempt += 1
+                await asyncio.sleep(delay)
+            result = _gateway_response(response)
+            self._cache_response(key, result, json)
+            return result
+
+        except httpx.TimeoutException:
+            if self.fail_open:
+                return await self._direct_request(
+                    method, url, json=json, data=data, headers=headers, params=params
+                )
+            raise EthicalZenError("Gateway request timed out", status_code=408)
+
+        except httpx.RequestError as e:
+            if self.fail_open:
+                return await self._direct_request(
+                    method, url, json=json, data=data, headers=headers, params=params
+                )
+            raise EthicalZenError(f"Gateway connection error: {e}")
+
+    async def _direct_request(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> ProxyResponse:
+        """Make a direct request (bypass gateway) for fail-open mode."""
+        origin = _origin(url)
+        client = self._direct_clients.get(origin)
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=self.timeout, http2=self._http2, limits=_direct_limits()
+            )
+            self._direct_clients[origin] = client
+        response = await client.request(method, url, **kwargs)
+        return _direct_response(response)
+
+    async def get(self, url: str, **kwargs: Any) -> ProxyResponse:
+        """Send a GET request through the gateway (async)."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> ProxyResponse:
+        """Send a POST request through the gateway (async)."""
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> ProxyResponse:
+        """Send a PUT request through the gateway (async)."""
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any) -> ProxyResponse:
+        """Send a PATCH request through the gateway (async)."""
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> ProxyResponse:
+        """Send a DELETE request through the gateway (async)."""
+        return await self.request("DELETE", url, **kwargs)
+
+    @overload
+    async def chat_completions(
+        self,
+        *,
+        target_api_key: Optional[str] = ...,
+        url: str = ...,
+        headers: Optional[Dict[str, str]] = ...,
+        stream: Literal[False] = ...,
+        **body: Any,
+    ) -> ProxyResponse: ...
+
+    @overload
+    async def chat_completions(
+        self,
+        *,
+        target_api_key: Optional[str] = ...,
+        url: str = ...,
+        headers: Optional[Dict[str, str]] = ...,
+        stream: Literal[True],
+        **body: Any,
+    ) -> AsyncIterator[str]: ...
+
+    async def chat_completions(
+        self,
+        *,
+        target_api_key: Optional[str] = None,
+        url: str = OPENAI_CHAT_COMPLETIONS_URL,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        **body: Any,
+    ) -> Union[ProxyResponse, AsyncIterator[str]]:
+        """
+        Create an OpenAI-style chat completion through the gateway (async).
+
+        With stream=True, returns an async iterator of content deltas:
+
+            async for delta in await proxy.chat_completions(..., stream=True):
+                print(delta, end="")
+        """
+        headers = self._chat_headers(target_api_key, headers)
+        if stream:
+            return self._stream_chat(url, {**body, "stream": True}, headers)
+        return await self.post(url, json=body, headers=headers)
+
+    async def _stream_chat(
+        self,
+        url: str,
+        body: Dict[str, Any],
+        headers: Optional[Dict[str, str]],
+    ) -> AsyncIterator[str]:
+        """Stream a chat completion, yielding content deltas as they arrive."""
+        profile = self._profile(url)
+        limiter = self._limiter_for(profile)
+        gateway_headers = self._gateway_headers("POST", url, headers, profile)
+        gateway_headers["Accept"] = "text/event-stream"
+        gateway_content = self._gateway_content(body, None, None)
+
+        await limiter.acquire(limiter.tokens_for(body))
+        try:
+            async for text in self._gateway_stream(gateway_headers, gateway_content):
+                yield text
+        except httpx.TimeoutException:
+            raise EthicalZenError("Gateway request timed out", status_code=408)
+        except httpx.RequestError as e:
+            raise EthicalZenError(f"Gateway connection error: {e}")
+        finally:
+            limiter.release()
+
+    async def batch_chat_completions(
+        self,
+        requests: List[Dict[str, Any]],
+        *,
+        target_api_key: Optional[str] = None,
+        url: str = OPENAI_CHAT_COMPLETIONS_URL,
+        headers: Optional[Dict[str, str]] = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> List[Union[ProxyResponse, BaseException]]:
+        """
+        Send many chat completions concurrently.
+
+        Args:
+            requests: Request bodies, one per completion
+            target_api_key: API key for the target LLM, shared by all requests
+            url: Chat completions endpoint (defaults to OpenAI)
+            headers: Extra headers for the target API
+            max_concurrency: Maximum requests in flight at once
+
+        Returns:
+            List in the same order as ``requests``, holding a ProxyResponse or
+            the exception raised for that request
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        chat_headers = self._chat_headers(target_api_key, headers)
+
+        async def one(body: Dict[str, Any]) -> ProxyResponse:
+            async with semaphore:
+                return await self.post(url, json=body, headers=chat_headers)
+
+        return list(await asyncio.gather(*[one(r) for r in requests], return_exceptions=True))
+
+    async def completions(
+        self,
+        prompt: Union[str, List[str]],
+        *,
+        target_api_key: Optional[str] = None,
+        url: str = OPENAI_COMPLETIONS_URL,
+        headers: Optional[Dict[str, str]] = None,
+        **body: Any,
+    ) -> ProxyResponse:
+        """Create an OpenAI-style (legacy) completion through the gateway (async)."""
+        return await self.post(
+            url,
+            json={**body, "prompt": prompt},
+            headers=self._chat_headers(target_api_key, headers),
+        )
+
+    async def completions_many(
+        self,
+        prompts: List[str],
+        *,
+        batch_size: int = DEFAULT_PROMPT_BATCH_SIZE,
+        **kwargs: Any,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Complete many prompts, sending batches concurrently (async). See EthicalZenProxy."""
+        batches = _prompt_batches(prompts, batch_size)
+        responses = await asyncio.gather(*[self.completions(batch, **kwargs) for batch in batches])
+        return _flatten_choices(list(responses), batches, kwargs.get("n", 1))
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
+        for client in self._direct_clients.values():
+            await client.aclose()
+        self._direct_clients.clear()
+
+    async def __aenter__(self) -> "AsyncEthicalZenProxy":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+
 # Convenience function to wrap OpenAI client
 def wrap_openai(
     openai_client: Any,
     api_key: Optional[str] = None,
     certificate_id: Optional[str] = None,
     gateway_url: Optional[str] = None,
+    client: Optional[httpx.Client] = None,
 ) -> "WrappedOpenAI":
     """
     Wrap an OpenAI client to route requests through EthicalZen.
@@ -411,12 +1525,15 @@ def wrap_openai(
             model="gpt-4",
             messages=[{"role": "user", "content": "Hello!"}]
         )
+
+    Wrappers share one process-wide connection pool unless ``client`` is given.
     """
     return WrappedOpenAI(
         openai_client=openai_client,
         ethicalzen_api_key=api_key,
         certificate_id=certificate_id,
         gateway_url=gateway_url,
+        client=client,
     )
 
 
@@ -429,12 +1546,14 @@ class WrappedOpenAI:
         ethicalzen_api_key: Optional[str] = None,
         certificate_id: Optional[str] = None,
         gateway_url: Optional[str] = None,
+        client: Optional[httpx.Client] = None,
     ):
         self._openai = openai_client
         self._proxy = EthicalZenProxy(
             api_key=ethicalzen_api_key,
             certificate_id=certificate_id,
             gateway_url=gateway_url,
+            client=client or _default_client(),
         )
         self.chat = WrappedChat(self._openai, self._proxy)
     
@@ -458,14 +1577,20 @@ class WrappedCompletions:
         self._openai = openai_client
         self._proxy = proxy
     
-    def create(self, **kwargs: Any) -> ProxyResponse:
+    @overload
+    def create(self, *, stream: Literal[False] = ..., **kwargs: Any) -> ProxyResponse: ...
+
+    @overload
+    def create(self, *, stream: Literal[True], **kwargs: Any) -> Iterator[str]: ...
+
+    def create(self, *, stream: bool = False, **kwargs: Any) -> Union[ProxyResponse, Iterator[str]]:
         """Create a chat completion through EthicalZen gateway."""
         openai_api_key = getattr(self._openai, "api_key", None) or os.environ.get("OPENAI_API_KEY")
         if not openai_api_key:
             raise AuthenticationError("OpenAI API key not found")
         
-        return self._proxy.post(
-            "https://api.openai.com/v1/chat/completions",
-            json=kwargs,
-            headers={"Authorization": f"Bearer {openai_api_key}"},
-        )
+        if stream:
+            return self._proxy.chat_completions(
+                target_api_key=openai_api_key, stream=True, **kwargs
+            )
+        return self._proxy.chat_completions(target_api_key=openai_api_key, stream=False, **kwargs)
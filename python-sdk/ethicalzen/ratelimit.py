@@ -0,0 +1,135 @@
+"""Client-side rate limiting for EthicalZen SDK."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Optional, Tuple
+
+from ethicalzen._json import dumps
+
+RATE_WINDOW = 60.0  # seconds; rpm/tpm are per minute
+
+
+def estimate_tokens(body: Any) -> int:
+    """Roughly estimate the tokens in an LLM request body (~4 bytes per token)."""
+    if isinstance(body, dict):
+        body = body.get("messages", body.get("prompt", body))
+    try:
+        return len(dumps(body)) // 4
+    except TypeError:
+        return 0
+
+
+class _SlidingWindow:
+    """Requests and tokens sent in the last RATE_WINDOW seconds."""
+
+    def __init__(self, rpm: Optional[int], tpm: Optional[int]):
+        self.rpm = rpm or None
+        self.tpm = tpm or None
+        self._sent: Deque[Tuple[float, int]] = deque()
+        self._tokens = 0
+
+    def reserve(self, tokens: int) -> float:
+        """Record a request if it fits, returning 0, else seconds until it might."""
+        now = time.monotonic()
+        sent = self._sent
+        while sent and sent[0][0] <= now - RATE_WINDOW:
+            self._tokens -= sent.popleft()[1]
+        full = (
+            (self.rpm is not None and len(sent) >= self.rpm)
+            # A request larger than tpm is let through once the window is empty
+            or (self.tpm is not None and sent and self._tokens + tokens > self.tpm)
+        )
+        if full:
+            return sent[0][0] + RATE_WINDOW - now
+        sent.append((now, tokens))
+        self._tokens += tokens
+        return 0.0
+
+
+class RateLimiter:
+    """
+    Thread-safe limit on requests per minute, tokens per minute and requests in flight.
+
+    Usage:
+        limiter = RateLimiter(rpm=500, max_concurrent=10)
+        limiter.acquire()
+        try:
+            ...
+        finally:
+            limiter.release()
+    """
+
+    def __init__(
+        self,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        max_concurrent: Optional[int] = None,
+    ):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_concurrent = max_concurrent
+        self._window = _SlidingWindow(rpm, tpm) if rpm or tpm else None
+        self._lock = threading.Lock()
+        self._semaphore = threading.Semaphore(max_concurrent) if max_concurrent else None
+
+    def tokens_for(self, body: Any) -> int:
+        """Token estimate for a request body, or 0 when tpm isn't limited."""
+        return estimate_tokens(body) if self.tpm else 0
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until a request may be sent."""
+        if self._window is not None:
+            while True:
+                with self._lock:
+                    delay = self._window.reserve(tokens)
+                if not delay:
+                    break
+                time.sleep(delay)
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+
+    def release(self) -> None:
+        """Mark a request acquired with acquire() as finished."""
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+
+class AsyncRateLimiter:
+    """Asyncio variant of RateLimiter, for use within one event loop."""
+
+    def __init__(
+        self,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        max_concurrent: Optional[int] = None,
+    ):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_concurrent = max_concurrent
+        self._window = _SlidingWindow(rpm, tpm) if rpm or tpm else None
+        # Created lazily so it binds to the running loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def tokens_for(self, body: Any) -> int:
+        """Token estimate for a request body, or 0 when tpm isn't limited."""
+        return estimate_tokens(body) if self.tpm else 0
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until a request may be sent."""
+        if self._window is not None:
+            while True:
+                delay = self._window.reserve(tokens)
+                if not delay:
+                    break
+                await asyncio.sleep(delay)
+        if self.max_concurrent:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            await self._semaphore.acquire()
+
+    def release(self) -> None:
+        """Mark a request acquired with acquire() as finished."""
+        if self._semaphore is not None:
+            self._semaphore.release()
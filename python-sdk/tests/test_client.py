@@ -1,16 +1,22 @@
 """Tests for EthicalZen client."""
 
+import asyncio
+import json
 import os
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
 import pytest
-from unittest.mock import Mock, patch
 
-from ethicalzen import EthicalZen, AsyncEthicalZen
-from ethicalzen.models import Decision, EvaluationResult
+from ethicalzen import AsyncEthicalZen, EthicalZen
 from ethicalzen.exceptions import (
+    APIError,
     AuthenticationError,
-    ValidationError,
+    GuardrailNotFoundError,
     RateLimitError,
+    ValidationError,
 )
+from ethicalzen.models import Decision, EvaluationResult
 
 
 class TestEthicalZenClient:
@@ -56,6 +62,366 @@ class TestEthicalZenClient:
             assert client.api_key == "test-key"
 
 
+def make_response(status_code=200, json_data=None, headers=None):
+    """Build a mock httpx.Response."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = json.dumps(json_data).encode() if json_data is not None else b""
+    response.text = response.content.decode()
+    return response
+
+
+class TestRequestEncoding:
+    """Tests for the requests sent on the wire."""
+
+    def test_evaluate_request(self):
+        """Test evaluate sends a complete JSON POST with client headers."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"decision": "allow", "score": 0.1})
+
+        client = EthicalZen(api_key="test-key", base_url="https://api.example.test/v1")
+        client._client._transport = httpx.MockTransport(handler)
+        client.evaluate(guardrail="pii_blocker", input="hello")
+        client.evaluate(guardrail="pii_blocker", input="hello again")
+
+        request = seen[-1]
+        assert str(request.url) == "https://api.example.test/v1/api/sg/evaluate"
+        assert request.headers["X-API-Key"] == "test-key"
+        assert request.headers["Content-Length"] == str(len(request.content))
+        assert json.loads(request.content) == {
+            "guardrail_id": "pii_blocker",
+            "input": "hello again",
+            "context": None,
+        }
+        assert request.extensions["timeout"]["read"] == 60.0
+        client.close()
+
+
+class TestMetadataCache:
+    """Tests for template listing cache and ETag revalidation."""
+
+    def test_templates_cached_then_revalidated(self):
+        """Test listings are cached and revalidated with If-None-Match."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                json={"templates": [{"type": "pii_blocker", "displayName": "PII"}]},
+                headers={"ETag": '"v1"'},
+            )
+
+        client = EthicalZen(api_key="test-key")
+        client._client._transport = httpx.MockTransport(handler)
+        first = client.list_templates()
+        client.list_templates()
+        assert len(seen) == 1
+
+        client._metadata.clear()  # simulate TTL expiry
+        second = client.list_templates()
+        assert len(seen) == 2
+        assert seen[-1].headers["If-None-Match"] == '"v1"'
+        assert [t.id for t in first] == [t.id for t in second] == ["pii_blocker"]
+        client.close()
+
+    def test_design_invalidates_guardrail_listing(self):
+        """Test a new guardrail shows up in the listing straight after design()."""
+        guardrails = []
+
+        def handler(request):
+            if request.url.path == "/api/sg/design":
+                guardrails.append({"id": "new_guardrail"})
+                return httpx.Response(200, json={"config": {"id": "new_guardrail"}})
+            return httpx.Response(
+                200, json={"guardrails": list(guardrails)}, headers={"ETag": '"v1"'}
+            )
+
+        client = EthicalZen(api_key="test-key")
+        client._client._transport = httpx.MockTransport(handler)
+        assert client.list_guardrails() == []
+
+        client.design(description="Block medical advice")
+
+        assert client.get_guardrail("new_guardrail").id == "new_guardrail"
+        client.close()
+
+
+class TestEvaluationCache:
+    """Tests for the evaluation result cache."""
+
+    def test_optimize_invalidates_cached_decisions(self):
+        """Test evaluate -> optimize -> evaluate asks the API again."""
+        evaluated = []
+
+        def handler(request):
+            if request.url.path == "/api/sg/optimize":
+                return httpx.Response(200, json={"success": True})
+            evaluated.append(request)
+            decision = "block" if len(evaluated) == 1 else "allow"
+            return httpx.Response(200, json={"decision": decision, "score": 0.5})
+
+        client = EthicalZen(api_key="test-key")
+        client._client._transport = httpx.MockTransport(handler)
+        assert client.evaluate(guardrail="g", input="x").is_blocked
+        assert client.evaluate(guardrail="g", input="x").is_blocked
+        assert len(evaluated) == 1
+
+        client.optimize("g")
+
+        assert not client.evaluate(guardrail="g", input="x").is_blocked
+        assert len(evaluated) == 2
+        client.close()
+
+    def test_repeated_evaluate_uses_cache(self):
+        """Test identical evaluations only hit the API once."""
+        client = EthicalZen(api_key="test-key")
+        with patch.object(
+            client._client, "send",
+            return_value=make_response(json_data={"decision": "block", "score": 0.9}),
+        ) as post:
+            first = client.evaluate(guardrail="pii_blocker", input="my ssn is 123")
+            second = client.evaluate(guardrail="pii_blocker", input="my ssn is 123")
+        assert post.call_count == 1
+        assert first.is_blocked and second.is_blocked
+        client.close()
+
+    def test_use_cache_false_and_clear_cache(self):
+        """Test bypassing and clearing the cache."""
+        client = EthicalZen(api_key="test-key")
+        with patch.object(
+            client._client, "send",
+            return_value=make_response(json_data={"decision": "allow", "score": 0.1}),
+        ) as post:
+            client.evaluate(guardrail="pii_blocker", input="hello")
+            client.evaluate(guardrail="pii_blocker", input="hello", use_cache=False)
+            client.clear_cache()
+            client.evaluate(guardrail="pii_blocker", input="hello")
+        assert post.call_count == 3
+        client.close()
+
+
+class TestNegativeCache:
+    """Tests for fail-fast on terminal API errors."""
+
+    def test_not_found_guardrail_fails_fast(self):
+        """Test a 404 guardrail is not requested again."""
+        client = EthicalZen(api_key="test-key")
+        with patch.object(
+            client._client, "send",
+            return_value=make_response(status_code=404, json_data={"guardrail_id": "missing"}),
+        ) as post:
+            for _ in range(3):
+                with pytest.raises(GuardrailNotFoundError):
+                    client.evaluate(guardrail="missing", input="hello")
+        assert post.call_count == 1
+        client.close()
+
+    def test_invalid_api_key_fails_fast(self):
+        """Test a 401 is remembered for the client's lifetime."""
+        client = EthicalZen(api_key="bad-key")
+        with patch.object(
+            client._client, "send", return_value=make_response(status_code=401),
+        ) as post:
+            with pytest.raises(AuthenticationError):
+                client.evaluate(guardrail="pii_blocker", input="hello")
+            with pytest.raises(AuthenticationError):
+                client.evaluate(guardrail="prompt_injection", input="hello")
+        assert post.call_count == 1
+        client.close()
+
+    def test_designed_guardrail_is_not_reported_missing(self):
+        """Test a listing miss isn't remembered, and design() forgets a past 404."""
+        evaluated = []
+
+        def handler(request):
+            if request.url.path == "/api/sg/list":
+                return httpx.Response(200, json={"guardrails": []})
+            if request.url.path == "/api/sg/design":
+                return httpx.Response(200, json={"config": {"id": "new_guardrail"}})
+            evaluated.append(request)
+            if len(evaluated) == 1:
+                return httpx.Response(404, json={"guardrail_id": "new_guardrail"})
+            return httpx.Response(200, json={"decision": "allow", "score": 0.1})
+
+        client = EthicalZen(api_key="test-key")
+        client._client._transport = httpx.MockTransport(handler)
+        with pytest.raises(GuardrailNotFoundError):
+            client.get_guardrail("new_guardrail")
+        with pytest.raises(GuardrailNotFoundError):
+            client.evaluate(guardrail="new_guardrail", input="hello")
+
+        client.design(description="Block medical advice")
+        result = client.evaluate(guardrail="new_guardrail", input="hello")
+
+        assert not result.is_blocked
+        assert len(evaluated) == 2
+        client.close()
+
+
+class TestEvaluateMany:
+    """Tests for evaluate_many."""
+
+    def test_batch_sends_single_request(self):
+        """Test batch mode posts all pairs at once and keeps order."""
+        client = EthicalZen(api_key="test-key", batch=True)
+        response = make_response(json_data={"results": [
+            {"decision": "allow", "score": 0.1},
+            {"decision": "block", "score": 0.9},
+        ]})
+        with patch.object(client._client, "send", return_value=response) as post:
+            results = client.evaluate_many([("pii_blocker", "hi"), ("prompt_injection", "hi")])
+        assert post.call_count == 1
+        assert post.call_args.args[0].url.path == "/api/sg/evaluate_batch"
+        assert [r.decision for r in results] == [Decision.ALLOW, Decision.BLOCK]
+        assert [r.guardrail_id for r in results] == ["pii_blocker", "prompt_injection"]
+        client.close()
+
+    def test_fallback_evaluates_each_pair(self):
+        """Test non-batch mode issues one evaluate request per pair."""
+        client = EthicalZen(api_key="test-key", batch=False)
+        with patch.object(
+            client._client, "send",
+            return_value=make_response(json_data={"decision": "allow", "score": 0.1}),
+        ) as post:
+            results = client.evaluate_many([("a", "one"), ("b", "two"), ("c", "three")])
+        assert post.call_count == 3
+        assert [r.guardrail_id for r in results] == ["a", "b", "c"]
+        client.close()
+
+
+class TestAsyncRetry:
+    """Tests for async client rate-limit handling."""
+
+    async def test_retries_rate_limited_request(self):
+        """Test a 429 is retried after the Retry-After delay."""
+        client = AsyncEthicalZen(api_key="test-key", max_retries=2)
+        responses = [
+            make_response(status_code=429, headers={"Retry-After": "2"}),
+            make_response(json_data={"decision": "allow", "score": 0.1}),
+        ]
+        with patch.object(client._client, "send", AsyncMock(side_effect=responses)) as post, \
+                patch("ethicalzen.client.asyncio.sleep", AsyncMock()) as sleep:
+            result = await client.evaluate(guardrail="pii_blocker", input="hello")
+        assert result.is_allowed
+        assert post.call_count == 2
+        sleep.assert_awaited_once_with(2.0)
+        await client.close()
+
+    async def test_http_date_retry_after_falls_back_to_backoff(self):
+        """Test an HTTP-date Retry-After is retried with backoff instead of raising."""
+        client = AsyncEthicalZen(api_key="test-key", max_retries=2)
+        responses = [
+            make_response(
+                status_code=429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+            ),
+            make_response(json_data={"decision": "allow", "score": 0.1}),
+        ]
+        with patch.object(client._client, "send", AsyncMock(side_effect=responses)) as post, \
+                patch("ethicalzen.client.asyncio.sleep", AsyncMock()) as sleep:
+            result = await client.evaluate(guardrail="pii_blocker", input="hello")
+        assert result.is_allowed
+        assert post.call_count == 2
+        sleep.assert_awaited_once_with(0.5)
+        await client.close()
+
+    async def test_gives_up_after_max_retries(self):
+        """Test RateLimitError is raised once retries are exhausted."""
+        client = AsyncEthicalZen(api_key="test-key", max_retries=1)
+        with patch.object(
+            client._client, "send",
+            AsyncMock(return_value=make_response(status_code=429)),
+        ), patch("ethicalzen.client.asyncio.sleep", AsyncMock()):
+            with pytest.raises(RateLimitError):
+                await client.evaluate(guardrail="pii_blocker", input="hello")
+        await client.close()
+
+
+class TestAsyncSingleFlight:
+    """Tests for coalescing concurrent identical evaluations."""
+
+    async def test_concurrent_identical_evaluations_share_request(self):
+        """Test concurrent identical evaluations issue one API call."""
+        client = AsyncEthicalZen(api_key="test-key")
+
+        async def slow_post(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return make_response(json_data={"decision": "allow", "score": 0.1})
+
+        with patch.object(client._client, "send", AsyncMock(side_effect=slow_post)) as post:
+            results = await asyncio.gather(
+                *[client.evaluate(guardrail="pii_blocker", input="hello") for _ in range(5)]
+            )
+        assert post.call_count == 1
+        assert all(r.is_allowed for r in results)
+        assert client._inflight == {}
+        await client.close()
+
+
+class TestSharedAsyncClient:
+    """Tests for AsyncEthicalZen.shared."""
+
+    async def test_shared_returns_same_instance(self):
+        """Test shared clients are reused per (api_key, base_url)."""
+        first = AsyncEthicalZen.shared(api_key="test-key", base_url="https://example.test")
+        second = AsyncEthicalZen.shared(api_key="test-key", base_url="https://example.test/")
+        other = AsyncEthicalZen.shared(api_key="other-key", base_url="https://example.test")
+        assert first is second
+        assert first is not other
+
+        await first.close()
+        fresh = AsyncEthicalZen.shared(api_key="test-key", base_url="https://example.test")
+        assert fresh is not first
+        await fresh.close()
+        await other.close()
+
+    def test_shared_client_per_event_loop(self):
+        """Test each asyncio.run() gets its own shared client, as in serverless handlers."""
+        seen = []
+
+        async def handler():
+            client = AsyncEthicalZen.shared(api_key="test-key", base_url="https://example.test")
+            client._client._transport = httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"decision": "allow", "score": 0.1})
+            )
+            seen.append(client)
+            return await client.evaluate(guardrail="pii_blocker", input="hello")
+
+        for _ in range(2):
+            assert not asyncio.run(handler()).is_blocked
+
+        assert seen[0] is not seen[1]
+        assert seen[0] not in AsyncEthicalZen._shared.values()
+        asyncio.run(seen[1].close())
+
+
+class TestAPIErrors:
+    """Tests for API error responses."""
+
+    def test_error_message_from_body(self):
+        client = EthicalZen(api_key="test-key")
+        response = make_response(500, {"error": "boom"})
+        with patch.object(client._client, "send", return_value=response):
+            with pytest.raises(APIError) as exc:
+                client.evaluate("g1", "hello")
+        assert exc.value.message == "boom"
+        assert exc.value.status_code == 500
+        client.close()
+
+    def test_error_message_falls_back_to_text(self):
+        response = make_response(502)
+        response.text = "Bad Gateway"
+        error = APIError.from_response(response)
+        assert error.message == "Bad Gateway"
+        assert error.response_body == "Bad Gateway"
+
+
 class TestEvaluationResult:
     """Tests for EvaluationResult model."""
 
@@ -83,6 +449,11 @@ class TestEvaluationResult:
         assert result.needs_review is False
         assert result.reason == "Test reason"
 
+    def test_lowercase_decision_is_normalized(self):
+        """Test API-style lowercase decisions are accepted."""
+        result = EvaluationResult(decision="block", score=0.9, guardrail_id="test")
+        assert result.decision == Decision.BLOCK
+
     def test_needs_review(self):
         """Test needs_review property."""
         result = EvaluationResult(
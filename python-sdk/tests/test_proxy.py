@@ -0,0 +1,697 @@
+"""Tests for EthicalZen proxy clients."""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from ethicalzen import AsyncEthicalZenProxy, EthicalZenError, EthicalZenProxy
+from ethicalzen.exceptions import APIError
+
+
+def gateway_handler(calls):
+    """MockTransport handler that echoes the target request as a chat completion."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        body = json.loads(request.content) if request.content else {}
+        if "blocked" in json.dumps(body):
+            return httpx.Response(403, json={"reason": "unsafe", "guardrail_id": "g1"})
+        content = body.get("messages", [{}])[-1].get("content", "")
+        return httpx.Response(
+            200,
+            json={"choices": [{"index": 0, "message": {"role": "assistant", "content": content}}]},
+        )
+
+    return handler
+
+
+class TestEthicalZenProxy:
+    """Tests for the sync proxy."""
+
+    def test_chat_completions_routes_through_gateway(self):
+        calls = []
+        proxy = EthicalZenProxy(api_key="test-key", certificate_id="dc_test")
+        proxy._client = httpx.Client(transport=httpx.MockTransport(gateway_handler(calls)))
+
+        response = proxy.chat_completions(
+            target_api_key="sk-test",
+            model="gpt-4",
+            messages=[{"role": "user", "content": "hi"}],
+        )
+
+        assert response.ok
+        assert response.content == "hi"
+        request = calls[0]
+        assert request.url.path == "/api/proxy"
+        assert request.headers["X-Contract-ID"] == "dc_test"
+        assert request.headers["Authorization"] == "Bearer sk-test"
+        assert request.headers["X-EthicalZen-Provider"] == "openai"
+        proxy.close()
+
+    def test_blocked_request(self):
+        calls = []
+        proxy = EthicalZenProxy(api_key="test-key")
+        proxy._client = httpx.Client(transport=httpx.MockTransport(gateway_handler(calls)))
+
+        response = proxy.chat_completions(
+            model="gpt-4", messages=[{"role": "user", "content": "blocked"}]
+        )
+
+        assert response.blocked
+        assert response.block_reason == "unsafe"
+        assert response.guardrail_id == "g1"
+        proxy.close()
+
+    def test_batch_chat_completions_returns_exceptions_in_place(self):
+        calls = []
+        handler = gateway_handler(calls)
+
+        def flaky(request):
+            if b"boom" in request.content:
+                raise httpx.ConnectError("down")
+            return handler(request)
+
+        proxy = EthicalZenProxy(api_key="test-key")
+        proxy._client = httpx.Client(transport=httpx.MockTransport(flaky))
+
+        responses = proxy.batch_chat_completions(
+            [
+                {"model": "gpt-4", "messages": [{"role": "user", "content": p}]}
+                for p in ["a", "boom", "c"]
+            ],
+            max_concurrency=2,
+        )
+
+        assert responses[0].content == "a"
+        assert isinstance(responses[1], EthicalZenError)
+        assert responses[2].content == "c"
+        proxy.close()
+
+    def test_completions_many_maps_choices_to_prompts(self):
+        calls = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            calls.append(body)
+            prompts = body["prompt"]
+            # Return choices out of order, as the API may
+            choices = [{"index": i, "text": p.upper()} for i, p in enumerate(prompts)][::-1]
+            return httpx.Response(200, json={"choices": choices})
+
+        proxy = EthicalZenProxy(api_key="test-key")
+        proxy._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        choices = proxy.completions_many(["a", "b", "c", "d", "e"], batch_size=2, model="m")
+
+        assert [c["text"] for c in choices] == ["A", "B", "C", "D", "E"]
+        assert [len(c["prompt"]) for c in calls] == [2, 2, 1]
+        proxy.close()
+
+    def test_completions_many_raises_on_failed_batch(self):
+        proxy = EthicalZenProxy(api_key="test-key")
+        proxy._client = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(400, json={"error": {"message": "bad prompt"}})
+            )
+        )
+
+        with pytest.raises(APIError) as excinfo:
+            proxy.completions_many(["a", "b", "c"], model="m")
+
+        assert excinfo.value.status_code == 400
+        assert excinfo.value.message == "bad prompt"
+        proxy.close()
+
+    def test_blocked_request_with_plain_text_body(self):
+        proxy = EthicalZenProxy(api_key="test-key")
+        proxy._client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(403, text="denied"))
+        )
+
+        response = proxy.get("https://api.example.com/resource")
+
+        assert response.blocked
+        assert response.block_reason == "denied"
+        proxy.close()
+
+    def test_retries_transient_gateway_errors(self):
+        statuses = [503, 429, 200]
+        sent = []
+
+        def handler(request):
+            sent.append(request)
+            status = statuses[len(sent) - 1]
+            headers = {"Retry-After": "2"} if status == 429 else {}
+            return httpx.Response(status, json={"ok": status == 200}, headers=headers)
+
+        proxy = EthicalZenProxy(api_key="test-key")
+        proxy._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        with patch("ethicalzen.proxy.time.sleep") as sleep:
+            response = proxy.get("https://api.example.com/resource")
+
+        assert response.ok
+        assert len(sent) == 3
+        assert sleep.call_args_list[1].args == (2.0,)
+        proxy.close()
+
+    def test_retry_after_is_clamped(self):
+        from ethicalzen.client import MAX_RETRY_BACKOFF
+        from ethicalzen.proxy import _retry_delay
+
+        def delay(value):
+            return _retry_delay(httpx.Response(429, headers={"Retry-After": value}), 0, 3)
+
+        assert delay("86400") == MAX_RETRY_BACKOFF
+        assert delay("-5") == 0.0
+
+    def test_fail_open_reuses_client_per_origin(self):
+        proxy = EthicalZenProxy(api_key="test-key", fail_open=True)
+
+        first = proxy._direct_client("https://api.openai.com/v1/chat/completions")
+        assert proxy._direct_client("https://api.openai.com/v1/completions") is first
+        assert proxy._direct_client("https://api.anthropic.com/v1/messages") is not first
+
+        proxy.close()
+        assert first.is_closed
+        assert not proxy._direct_clients
+
+
+def sse_handler(events):
+    """MockTransport handler that streams the given SSE data payloads."""
+
+    def handler(request):
+        body = "".join(f"data: {e}\n\n" for e in events)
+        return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+    return handler
+
+
+def delta(text):
+    return json.dumps({"choices": [{"index": 0, "delta": {"content": text}}]})
+
+
+class TestStreaming:
+    """Tests for streamed chat completions."""
+
+    def test_stream_yields_deltas(self):
+        proxy = EthicalZenProxy(api_key="test-key")
+        proxy._client = httpx.Client(
+            transport=httpx.MockTransport(sse_handler([delta("Hel"), delta("lo"), "[DONE]"]))
+        )
+
+        chunks = list(proxy.chat_completions(model="gpt-4", messages=[], stream=True))
+
+        assert chunks == ["Hel", "lo"]
+        proxy.close()
+
+    def test_stream_ends_with_block_event(self):
+        events = [
+            delta("Take"),
+            json.dumps({"blocked": True, "reason": "medical advice"}),
+            delta("X"),
+        ]
+        proxy = EthicalZenProxy(api_key="test-key")
+        proxy._client = httpx.Client(transport=httpx.MockTransport(sse_handler(events)))
+
+        chunks = list(proxy.chat_completions(model="gpt-4", messages=[], stream=True))
+
+        assert chunks == ["Take", "[BLOCKED] medical advice"]
+        proxy.close()
+
+    async def test_async_stream_blocked_request(self):
+        async with AsyncEthicalZenProxy(api_key="test-key") as proxy:
+            await proxy._client.aclose()
+            proxy._client = httpx.AsyncClient(
+                transport=httpx.MockTransport(
+                    lambda r: httpx.Response(403, json={"reason": "unsafe"})
+                )
+            )
+
+            stream = await proxy.chat_completions(model="gpt-4", messages=[], stream=True)
+            chunks = [c async for c in stream]
+
+        assert chunks == ["[BLOCKED] unsafe"]
+
+
+class TestProxyCache:
+    """Tests for the proxy response cache."""
+
+    def make_proxy(self, calls, **kwargs):
+        kwargs.setdefault("cache_size", 16)
+        proxy = EthicalZenProxy(api_key="test-key", **kwargs)
+        proxy._client = httpx.Client(transport=httpx.MockTransport(gateway_handler(calls)))
+        return proxy
+
+    def test_deterministic_request_is_cached(self):
+        calls = []
+        proxy = self.make_proxy(calls)
+        messages = [{"role": "user", "content": "hi"}]
+
+        first = proxy.chat_completions(model="gpt-4", messages=messages, temperature=0)
+        second = proxy.chat_completions(model="gpt-4", messages=messages, temperature=0)
+
+        assert second is first
+        assert len(calls) == 1
+        proxy.chat_completions(
+            model="gpt-4", messages=messages, temperature=0, target_api_key="other"
+        )
+        assert len(calls) == 2
+        proxy.close()
+
+    def test_sampled_and_blocked_requests_are_not_cached(self):
+        calls = []
+        proxy = self.make_proxy(calls)
+
+        for _ in range(2):
+            proxy.chat_completions(model="gpt-4", messages=[{"role": "user", "content": "hi"}])
+            proxy.chat_completions(
+                model="gpt-4", messages=[{"role": "user", "content": "blocked"}], temperature=0
+            )
+
+        assert len(calls) == 4
+        proxy.close()
+
+    def test_exact_match_only_disabled(self):
+        calls = []
+        proxy = self.make_proxy(calls, exact_match_only=False)
+
+        for _ in range(2):
+            proxy.chat_completions(model="gpt-4", messages=[{"role": "user", "content": "hi"}])
+
+        assert len(calls) == 1
+        proxy.close()
+
+    def test_plain_dict_cache(self):
+        calls = []
+        cache = {}
+        proxy = self.make_proxy(calls, cache=cache)
+
+        for _ in range(2):
+            proxy.chat_completions(
+                model="gpt-4", messages=[{"role": "user", "content": "hi"}], temperature=0
+            )
+
+        assert len(calls) == 1
+        assert len(cache) == 1
+        proxy.close()
+
+    def test_disk_cache_persists_across_instances(self, tmp_path):
+        calls = []
+        messages = [{"role": "user", "content": "hi"}]
+
+        first = self.make_proxy(calls, cache_dir=str(tmp_path))
+        first.chat_completions(model="gpt-4", messages=messages, temperature=0)
+        first.chat_completions(model="gpt-4", messages=messages)
+        first.close()
+
+        second = self.make_proxy(calls, cache_dir=str(tmp_path))
+        response = second.chat_completions(model="gpt-4", messages=messages, temperature=0)
+
+        assert response.content == "hi"
+        assert len(calls) == 2
+        assert len(list(tmp_path.glob("*.json"))) == 1  # the sampled request isn't stored
+        assert second.cache_stats() == {"hits": 1, "misses": 0}
+        second.clear_cache()
+        assert not list(tmp_path.iterdir())
+        second.close()
+
+    def test_disk_cache_is_scoped_to_gateway_credentials(self, tmp_path):
+        calls = []
+        messages = [{"role": "user", "content": "hi"}]
+
+        tenant_a = self.make_proxy(calls, cache_dir=str(tmp_path), tenant_id="a")
+        tenant_a.chat_completions(model="gpt-4", messages=messages, temperature=0)
+        tenant_b = self.make_proxy(calls, cache_dir=str(tmp_path), tenant_id="b")
+        tenant_b.chat_completions(model="gpt-4", messages=messages, temperature=0)
+
+        assert len(calls) == 2
+        tenant_a.close()
+        tenant_b.close()
+
+    def test_disk_cache_ignores_malformed_entries(self, tmp_path):
+        calls = []
+        messages = [{"role": "user", "content": "hi"}]
+        proxy = self.make_proxy(calls, cache_dir=str(tmp_path), cache_size=0)
+        proxy.chat_completions(model="gpt-4", messages=messages, temperature=0)
+        (entry,) = tmp_path.glob("*.json")
+        entry.write_text('[null, {"data": {}}]')
+
+        response = proxy.chat_completions(model="gpt-4", messages=messages, temperature=0)
+
+        assert response.content == "hi"
+        assert len(calls) == 2
+        proxy.close()
+
+    def test_disk_cache_size_limit_and_ttl(self, tmp_path):
+        from ethicalzen.cache import DiskCache
+
+        cache = DiskCache(str(tmp_path), size_limit=100)
+        for i in range(10):
+            cache.set(bytes([i]), "x" * 20)
+        assert sum(p.stat().st_size for p in tmp_path.glob("*.json")) <= 100
+        assert cache.get(bytes([9])) == "x" * 20
+
+        expired = DiskCache(str(tmp_path), ttl=-1)
+        expired.set(b"k", "v")
+        assert expired.get(b"k") is None
+
+    def test_disk_cache_scans_lazily_and_evicts_below_limit(self, tmp_path):
+        from ethicalzen.cache import DiskCache
+
+        for i in range(10):  # 30 bytes each on disk
+            (tmp_path / f"{i:02x}.json").write_text(json.dumps([None, "x" * 20]))
+        with patch("ethicalzen.cache.os.listdir", wraps=__import__("os").listdir) as listdir:
+            cache = DiskCache(str(tmp_path), size_limit=300)
+            assert listdir.call_count == 0
+            cache.set(b"\x10", "x" * 20)
+            assert listdir.call_count == 1
+            # Eviction left headroom, so the next write doesn't rescan
+            cache.set(b"\x11", "x" * 20)
+            assert listdir.call_count == 1
+        assert sum(p.stat().st_size for p in tmp_path.glob("*.json")) <= 300
+        assert cache.get(b"\x11") == "x" * 20
+
+    def test_disk_cache_drops_sensitive_headers(self, tmp_path):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={"choices": []},
+                headers={"Set-Cookie": "session=secret", "X-Request-Id": "r1"},
+            )
+
+        proxy = EthicalZenProxy(api_key="test-key", cache_dir=str(tmp_path))
+        proxy._client = httpx.Client(transport=httpx.MockTransport(handler))
+        proxy.chat_completions(
+            model="gpt-4", messages=[{"role": "user", "content": "hi"}], temperature=0
+        )
+
+        (entry,) = tmp_path.glob("*.json")
+        _, stored = json.loads(entry.read_text())
+        assert stored["headers"]["x-request-id"] == "r1"
+        assert "set-cookie" not in {name.lower() for name in stored["headers"]}
+        proxy.close()
+
+
+class TestProxyResponse:
+    """Tests for ProxyResponse accessors."""
+
+    def test_openai_fields(self):
+        from ethicalzen import ProxyResponse
+
+        data = {
+            "id": "chatcmpl-1",
+            "model": "gpt-4",
+            "usage": {"total_tokens": 3},
+            "choices": [{"index": 0, "message": {"content": "hi"}}],
+        }
+        response = ProxyResponse(status_code=200, data=data, headers={})
+
+        assert (response.id, response.model, response.usage) == (
+            "chatcmpl-1",
+            "gpt-4",
+            {"total_tokens": 3},
+        )
+        assert response.content == "hi"
+        assert "content" in vars(response)  # parsed once, then cached
+
+    def test_non_dict_body(self):
+        from ethicalzen import ProxyResponse
+
+        response = ProxyResponse(status_code=200, data="plain", headers={})
+
+        assert response.choices == []
+        assert response.usage is None
+        assert response.content == ""
+
+
+class TestProviderProfiles:
+    """Tests for provider detection."""
+
+    def test_detect_provider(self):
+        from ethicalzen.providers import GENERIC_PROFILE, detect_provider
+
+        assert detect_provider("api.openai.com").name == "openai"
+        assert detect_provider("myres.openai.azure.com").name == "azure-openai"
+        assert 529 in detect_provider("api.anthropic.com").retry_status_codes
+        assert detect_provider("api.example.com") is GENERIC_PROFILE
+
+    def test_provider_limits_are_opt_in(self):
+        proxy = EthicalZenProxy(api_key="test-key")
+        profile = proxy._profile("https://api.anthropic.com/v1/messages")
+        assert proxy._limiter_for(profile) is proxy._limiter
+        proxy.close()
+
+        proxy = EthicalZenProxy(api_key="test-key", provider_limits=True, rpm=10)
+        limiter = proxy._limiter_for(proxy._profile("https://api.anthropic.com/v1/messages"))
+        assert (limiter.rpm, limiter.tpm, limiter.max_concurrent) == (10, 40_000, 5)
+        proxy.close()
+
+    def test_concurrent_requests_share_one_provider_limiter(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from ethicalzen.ratelimit import RateLimiter
+
+        def slow_limiter(**kwargs):
+            time.sleep(0.01)  # widen the window between lookup and insert
+            return RateLimiter(**kwargs)
+
+        proxy = EthicalZenProxy(api_key="test-key", provider_limits=True)
+        profile = proxy._profile("https://api.anthropic.com/v1/messages")
+        with patch.object(proxy, "_limiter_class", slow_limiter):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                limiters = list(pool.map(lambda _: proxy._limiter_for(profile), range(8)))
+
+        assert len({id(limiter) for limiter in limiters}) == 1
+        proxy.close()
+
+
+class TestAsyncEthicalZenProxy:
+    """Tests for the async proxy."""
+
+    async def test_batch_chat_completions_preserves_order(self):
+        calls = []
+        async with AsyncEthicalZenProxy(api_key="test-key") as proxy:
+            await proxy._client.aclose()
+            proxy._client = httpx.AsyncClient(transport=httpx.MockTransport(gateway_handler(calls)))
+
+            prompts = ["one", "two", "blocked", "four"]
+            responses = await proxy.batch_chat_completions(
+                [{"model": "gpt-4", "messages": [{"role": "user", "content": p}]} for p in prompts],
+                target_api_key="sk-test",
+            )
+
+        assert len(calls) == 4
+        assert [r.content for r in responses if not r.blocked] == ["one", "two", "four"]
+        assert responses[2].blocked
+
+    async def test_identical_inflight_requests_share_one_call(self):
+        calls = []
+        handler = gateway_handler(calls)
+
+        async def slow(request):
+            await asyncio.sleep(0.01)
+            return handler(request)
+
+        async with AsyncEthicalZenProxy(api_key="test-key") as proxy:
+            await proxy._client.aclose()
+            proxy._client = httpx.AsyncClient(transport=httpx.MockTransport(slow))
+
+            body = {
+                "model": "gpt-4",
+                "messages": [{"role": "user", "content": "hi"}],
+                "temperature": 0,
+            }
+            responses = await asyncio.gather(*[proxy.chat_completions(**body) for _ in range(5)])
+
+            assert len(calls) == 1
+            assert all(r.content == "hi" for r in responses)
+            assert not proxy._inflight
+
+
+class TestSharedClient:
+    """Tests for connection pool sharing."""
+
+    def test_wrappers_share_default_client(self):
+        from ethicalzen import wrap_openai
+
+        openai_client = type("OpenAI", (), {"api_key": "sk-test"})()
+        first = wrap_openai(openai_client, api_key="test-key")
+        second = wrap_openai(openai_client, api_key="test-key")
+
+        assert first._proxy._client is second._proxy._client
+        first.close()
+        assert not second._proxy._client.is_closed
+
+    def test_passed_client_is_not_closed(self):
+        client = httpx.Client()
+        proxy = EthicalZenProxy(api_key="test-key", client=client)
+        proxy.close()
+        assert not client.is_closed
+        client.close()
+
+
+class TestRateLimiter:
+    """Tests for client-side rate limiting."""
+
+    def test_requests_per_minute(self):
+        from ethicalzen.ratelimit import _SlidingWindow
+
+        window = _SlidingWindow(rpm=2, tpm=None)
+        assert window.reserve(0) == 0
+        assert window.reserve(0) == 0
+        assert 59 < window.reserve(0) <= 60
+
+    def test_tokens_per_minute(self):
+        from ethicalzen.ratelimit import _SlidingWindow
+
+        window = _SlidingWindow(rpm=None, tpm=100)
+        # Oversized requests go through on an empty window
+        assert window.reserve(150) == 0
+        assert window.reserve(1) > 0
+
+    async def test_async_max_concurrent(self):
+        in_flight = []
+        peak = []
+
+        async def handler(request):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.pop()
+            return httpx.Response(200, json={})
+
+        async with AsyncEthicalZenProxy(api_key="test-key", max_concurrent=2) as proxy:
+            await proxy._client.aclose()
+            proxy._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            await asyncio.gather(
+                *[proxy.post("https://api.example.com/x", json={"i": i}) for i in range(6)]
+            )
+
+        assert max(peak) == 2
+
+
+class TestAiohttpProxy:
+    """Tests for the aiohttp-backed proxy."""
+
+    def test_requires_aiohttp(self):
+        with patch("ethicalzen.aiohttp_proxy.AIOHTTP_AVAILABLE", False):
+            from ethicalzen.aiohttp_proxy import AiohttpEthicalZenProxy
+
+            with pytest.raises(ImportError, match="ethicalzen\\[aiohttp\\]"):
+                AiohttpEthicalZenProxy(api_key="test-key")
+
+    def test_rejects_httpx_pool_options(self):
+        pytest.importorskip("aiohttp")
+        from ethicalzen.aiohttp_proxy import AiohttpEthicalZenProxy
+
+        with pytest.raises(TypeError, match="http2, max_connections"):
+            AiohttpEthicalZenProxy(api_key="test-key", http2=False, max_connections=10)
+
+    async def serve(self, handler):
+        """Start a local gateway whose /api/proxy route is handled by handler."""
+        web = pytest.importorskip("aiohttp.web")
+        from aiohttp.test_utils import TestServer
+
+        app = web.Application()
+        app.router.add_post("/api/proxy", handler)
+        server = TestServer(app)
+        await server.start_server()
+        return server
+
+    async def test_chat_completions_with_compressed_response(self):
+        from aiohttp import web
+
+        from ethicalzen.aiohttp_proxy import AiohttpEthicalZenProxy
+
+        async def handler(request):
+            body = await request.json()
+            response = web.json_response(
+                {"choices": [{"index": 0, "message": {"content": body["messages"][-1]["content"]}}]}
+            )
+            response.enable_compression()
+            return response
+
+        server = await self.serve(handler)
+        async with AiohttpEthicalZenProxy(
+            api_key="test-key", gateway_url=str(server.make_url(""))
+        ) as proxy:
+            response = await proxy.chat_completions(
+                model="gpt-4", messages=[{"role": "user", "content": "hi"}]
+            )
+        await server.close()
+
+        assert response.ok
+        assert response.content == "hi"
+        assert "content-encoding" not in {k.lower() for k in response.headers}
+
+    async def test_stream_reads_server_sent_events(self):
+        from aiohttp import web
+
+        from ethicalzen.aiohttp_proxy import AiohttpEthicalZenProxy
+
+        async def handler(request):
+            response = web.StreamResponse(headers={"content-type": "text/event-stream"})
+            await response.prepare(request)
+            for event in [delta("Hel"), delta("lo"), "[DONE]", delta("X")]:
+                await response.write(f"data: {event}\n\n".encode())
+            return response
+
+        server = await self.serve(handler)
+        async with AiohttpEthicalZenProxy(
+            api_key="test-key", gateway_url=str(server.make_url(""))
+        ) as proxy:
+            stream = await proxy.chat_completions(model="gpt-4", messages=[], stream=True)
+            chunks = [c async for c in stream]
+        await server.close()
+
+        assert chunks == ["Hel", "lo"]
+
+    async def test_stream_may_outlast_timeout(self):
+        from aiohttp import web
+
+        from ethicalzen.aiohttp_proxy import AiohttpEthicalZenProxy
+
+        async def handler(request):
+            response = web.StreamResponse(headers={"content-type": "text/event-stream"})
+            await response.prepare(request)
+            for piece in ["a", "b", "c", "d"]:
+                await asyncio.sleep(0.1)
+                await response.write(f"data: {delta(piece)}\n\n".encode())
+            return response
+
+        server = await self.serve(handler)
+        async with AiohttpEthicalZenProxy(
+            api_key="test-key", gateway_url=str(server.make_url("")), timeout=0.3
+        ) as proxy:
+            stream = await proxy.chat_completions(model="gpt-4", messages=[], stream=True)
+            chunks = [c async for c in stream]
+        await server.close()
+
+        assert chunks == ["a", "b", "c", "d"]
+
+    async def test_timeout_and_connection_errors_are_mapped(self):
+        from ethicalzen.aiohttp_proxy import AiohttpEthicalZenProxy
+
+        async def slow(request):
+            await asyncio.sleep(1)
+
+        server = await self.serve(slow)
+        async with AiohttpEthicalZenProxy(
+            api_key="test-key", gateway_url=str(server.make_url("")), timeout=0.05, max_retries=0
+        ) as proxy:
+            with pytest.raises(EthicalZenError) as excinfo:
+                await proxy.get("https://api.example.com/resource")
+        url = str(server.make_url(""))
+        await server.close()
+        assert excinfo.value.status_code == 408
+
+        async with AiohttpEthicalZenProxy(
+            api_key="test-key", gateway_url=url, max_retries=0
+        ) as proxy:
+            with pytest.raises(EthicalZenError, match="connection error"):
+                await proxy.get("https://api.example.com/resource")